@@ -1,65 +1,220 @@
 """Alembic async migration environment.
 
-Reads DATABASE_URL_SYNC from app.config.settings so there is a single
-source of truth for the connection string.
+The connection string comes from the DATABASE_URL_SYNC environment
+variable (or sqlalchemy.url in alembic.ini); app.config.settings is only
+imported as a fallback, so .env parsing and Pydantic validation stay off
+the common path.
 """
 
+import importlib
+import importlib.util
+import io
+import logging
+import os
+import pickle
+import pkgutil
+import sys
+import types
+from concurrent.futures import ThreadPoolExecutor
 from logging.config import fileConfig
+from pathlib import Path
 
 from alembic import context
-from sqlalchemy import engine_from_config, pool
-
-from app.config import settings
-from app.database import Base
-
-# ── Import ALL model modules so Base.metadata is fully populated ────────────
-# Core CRM
-from app.modules.users import models as _users  # noqa: F401
-from app.modules.students import models as _students  # noqa: F401
-from app.modules.cases import models as _cases  # noqa: F401
-from app.modules.applications import models as _applications  # noqa: F401
-from app.modules.documents import models as _documents  # noqa: F401
-from app.modules.tasks import models as _tasks  # noqa: F401
-from app.modules.events import models as _events  # noqa: F401
-from app.modules.approvals import models as _approvals  # noqa: F401
-from app.modules.notifications import models as _notifications  # noqa: F401
-from app.modules.workflows import models as _workflows  # noqa: F401
-from app.modules.ai_artifacts import models as _ai_artifacts  # noqa: F401
-from app.modules.policies import models as _policies  # noqa: F401
-
-# Legacy tables (read-only — included for completeness, Alembic won't modify)
-from app.modules.leads import models as _leads  # noqa: F401
-from app.modules.courses import models as _courses  # noqa: F401
-from app.modules.profiles import models as _profiles  # noqa: F401
-from app.modules.geography import models as _geography  # noqa: F401
-from app.modules.intakes import models as _intakes  # noqa: F401
-from app.modules.jobs import models as _jobs  # noqa: F401
-from app.modules.call_events import models as _call_events  # noqa: F401
-from app.modules.chat import models as _chat  # noqa: F401
-from app.modules.payments import models as _payments  # noqa: F401
-from app.modules.attendance import models as _attendance  # noqa: F401
-from app.modules.ig_sessions import models as _ig_sessions  # noqa: F401
-from app.modules.saved_items import models as _saved_items  # noqa: F401
-from app.modules.search import models as _search  # noqa: F401
-from app.modules.freelance import models as _freelance  # noqa: F401
-from app.modules.push_tokens import models as _push_tokens  # noqa: F401
-from app.modules.utility import models as _utility  # noqa: F401
-
-# Employee automation
-from app.modules.employee_automation import models as _emp_auto  # noqa: F401
+
+import app.modules
+
+
+# Modules that only map legacy tables (owned by the Flutter apps, never
+# modified by Alembic). ALEMBIC_SKIP_LEGACY=1 leaves them out of the metadata.
+# call_events is not listed: eb_call_analyses has a foreign key to it.
+LEGACY_MODULES = (
+    "leads", "courses", "profiles", "geography", "intakes", "jobs",
+    "chat", "payments", "attendance", "ig_sessions",
+    "saved_items", "search", "freelance", "push_tokens", "utility",
+)
+SKIP_LEGACY = os.getenv("ALEMBIC_SKIP_LEGACY") == "1"
+
+
+def _model_modules() -> list[str]:
+    """Names of every ``app.modules.<name>`` package that has a models module."""
+    names = [
+        mod.name.rpartition(".")[2]
+        for mod in pkgutil.iter_modules(app.modules.__path__, prefix="app.modules.")
+        if mod.ispkg and importlib.util.find_spec(f"{mod.name}.models") is not None
+    ]
+    unknown = set(LEGACY_MODULES).difference(names)
+    if unknown:
+        raise RuntimeError(f"LEGACY_MODULES lists modules without models: {sorted(unknown)}")
+    return names
+
+
+def _import_all_models() -> None:
+    """Import every ``app.modules.<name>.models`` so Base.metadata is fully populated.
+
+    Only modules literally named ``models`` are loaded — sibling schemas,
+    routers and services are never touched. Packages without a models
+    module (e.g. analytics, ws) are skipped.
+
+    The imports are I/O-bound (stat, open, bytecode load) and no models
+    module imports another, so they run on a small thread pool; the
+    per-module import lock keeps shared dependencies single-initialised.
+    """
+    names = [
+        f"app.modules.{name}.models"
+        for name in _model_modules()
+        if not (SKIP_LEGACY and name in LEGACY_MODULES)
+    ]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(importlib.import_module, names))
+
+
+# ── Metadata cache ─────────────────────────────────────────────────────────
+# Autogenerate spends most of its warm-up rebuilding the same MetaData from
+# every models.py. The pickled result is reused until any file that defines
+# tables, or that the models import from app.config/app.core (ids, enums),
+# changes, or the SQLAlchemy version does.
+_METADATA_CACHE_DIR = Path(__file__).resolve().parent.parent / ".alembic-metadata-cache"
+_METADATA_SOURCES = (
+    "app/config.py", "app/database.py", "app/core/*.py", "app/modules/*/models.py",
+)
+_CACHE_SCOPE = "core" if SKIP_LEGACY else "all"
+
+
+def _metadata_cache_key() -> str:
+    import sqlalchemy
+
+    root = _METADATA_CACHE_DIR.parent
+    files = [f for pattern in _METADATA_SOURCES for f in root.glob(pattern)]
+    newest = max(f.stat().st_mtime_ns for f in files)
+    return f"{_CACHE_SCOPE}-{sqlalchemy.__version__}-{len(files)}-{newest}"
+
+
+def _importable(fn: types.FunctionType) -> bool:
+    owner = sys.modules.get(fn.__module__)
+    return owner is not None and getattr(owner, fn.__qualname__, None) is fn
+
+
+class _MetadataPickler(pickle.Pickler):
+    """Pickler that copes with Python-side column defaults.
+
+    SQLAlchemy wraps callables such as ``uuid.uuid4`` in closures and models
+    may use lambdas; neither pickles by reference. Autogenerate never calls
+    Python-side defaults, so wrapped callables are stored as their original
+    function and anything else unimportable is stored as None.
+    """
+
+    def reducer_override(self, obj):
+        if isinstance(obj, types.FunctionType) and not _importable(obj):
+            wrapped = getattr(obj, "__wrapped__", None)
+            if isinstance(wrapped, types.FunctionType) and _importable(wrapped):
+                return pkgutil.resolve_name, (f"{wrapped.__module__}:{wrapped.__qualname__}",)
+            return type(None), ()
+        return NotImplemented
+
+
+def _load_target_metadata():
+    """Return the combined MetaData, from the on-disk cache when it is fresh."""
+    cache_file = _METADATA_CACHE_DIR / f"{_metadata_cache_key()}.pkl"
+    if cache_file.exists():
+        try:
+            with cache_file.open("rb") as fh:
+                return pickle.load(fh)
+        except Exception:
+            pass  # unreadable or incompatible — rebuild below
+
+    from app.database import Base
+
+    _import_all_models()
+
+    try:
+        buf = io.BytesIO()
+        _MetadataPickler(buf, protocol=pickle.HIGHEST_PROTOCOL).dump(Base.metadata)
+        _METADATA_CACHE_DIR.mkdir(exist_ok=True)
+        for stale in _METADATA_CACHE_DIR.glob(f"{_CACHE_SCOPE}-*.pkl"):
+            stale.unlink(missing_ok=True)
+        cache_file.write_bytes(buf.getvalue())
+    except (OSError, pickle.PicklingError, TypeError):
+        pass  # caching is best-effort (e.g. read-only checkout)
+    return Base.metadata
+
 
 # ── Alembic Config object ──────────────────────────────────────────────────
 config = context.config
 
-# Interpret the config file for Python logging.
-if config.config_file_name is not None:
-    fileConfig(config.config_file_name)
+# Interpret the config file for Python logging. Runs embedded in a process
+# that already configured logging can skip the INI parse with
+# ALEMBIC_SKIP_LOGGING=1.
+if config.config_file_name is not None and os.getenv("ALEMBIC_SKIP_LOGGING") != "1":
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
+
+
+def _database_url() -> str:
+    """Resolve the sync database URL, importing app settings only as a fallback."""
+    url = os.environ.get("DATABASE_URL_SYNC") or config.get_main_option("sqlalchemy.url")
+    if url:
+        return url
+
+    from app.config import settings
+
+    # Same derivation as app.database.sync_session_factory
+    return settings.DATABASE_URL_SYNC or settings.DATABASE_URL.replace(
+        "postgresql+asyncpg://", "postgresql://"
+    )
+
 
-# Set SQLAlchemy URL from application settings (single source of truth)
-config.set_main_option("sqlalchemy.url", settings.DATABASE_URL_SYNC)
+config.set_main_option("sqlalchemy.url", _database_url())
 
-# Metadata for autogenerate support
-target_metadata = Base.metadata
+
+def _needs_metadata() -> bool:
+    """Return True when the running command diffs the database against the models.
+
+    Only ``revision --autogenerate`` and ``check`` read target_metadata;
+    upgrade/downgrade/stamp/current/history (online or ``--sql``) never do.
+    Programmatic invocations carry no command-line options, so they get the
+    full metadata to be safe.
+    """
+    opts = config.cmd_opts
+    if opts is None or not hasattr(opts, "cmd"):
+        return True
+    command = opts.cmd[0].__name__
+    return command == "check" or bool(getattr(opts, "autogenerate", False))
+
+
+# Metadata for autogenerate support — None for commands that never compare
+# against the models, so production upgrades skip the ORM import cost.
+if _needs_metadata():
+    target_metadata = _load_target_metadata()
+else:
+    target_metadata = None
+
+
+def _is_managed_table(name: str) -> bool:
+    # Alembic owns the eb_* tables only; legacy tables keep their schema.
+    return name.startswith("eb_")
+
+
+def _include_name(name, type_, parent_names) -> bool:
+    """Skip reflecting legacy tables at all during autogenerate."""
+    if type_ == "table":
+        return _is_managed_table(name)
+    return True
+
+
+def _include_object(obj, name, type_, reflected, compare_to) -> bool:
+    """Keep legacy model tables out of the diff (no create/drop proposals)."""
+    if type_ == "table":
+        return _is_managed_table(name)
+    return True
+
+
+# Options shared by offline and online runs. Only the public schema is
+# compared, and server defaults are left out of the diff.
+_CONFIGURE_OPTS = dict(
+    include_name=_include_name,
+    include_object=_include_object,
+    include_schemas=False,
+    compare_server_default=False,
+)
 
 
 def run_migrations_offline() -> None:
@@ -73,6 +228,47 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        **_CONFIGURE_OPTS,
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+_INVALID_INDEXES_SQL = """
+    SELECT c.relname
+    FROM pg_index i
+    JOIN pg_class c ON c.oid = i.indexrelid
+    JOIN pg_namespace n ON n.oid = c.relnamespace
+    WHERE NOT i.indisvalid AND n.nspname = 'public'
+    ORDER BY c.relname
+"""
+
+
+def _warn_invalid_indexes(connection) -> None:
+    """Log indexes left INVALID by an interrupted CREATE INDEX CONCURRENTLY.
+
+    Index migrations use ``IF NOT EXISTS``, so a re-run silently skips a
+    half-built index instead of rebuilding it. They are only reported, not
+    dropped: a build still running in another session looks the same.
+    """
+    from sqlalchemy import text
+
+    names = connection.execute(text(_INVALID_INDEXES_SQL)).scalars().all()
+    if names:
+        logging.getLogger("alembic.env").warning(
+            "Invalid indexes (DROP INDEX CONCURRENTLY and re-run the migration "
+            "that creates them): %s",
+            ", ".join(names),
+        )
+    connection.rollback()  # end the autobegun transaction before Alembic starts its own
+
+
+def _run_with_connection(connection) -> None:
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        **_CONFIGURE_OPTS,
     )
 
     with context.begin_transaction():
@@ -82,19 +278,29 @@ def run_migrations_offline() -> None:
 def run_migrations_online() -> None:
     """Run migrations in 'online' mode.
 
-    Creates an engine and connects to the database.
+    A single connection is held for the whole run, so every migration step
+    shares it. Callers that drive several alembic commands in one process
+    (tests, bootstrap scripts) can pass their own connection via
+    ``config.attributes["connection"]`` to skip engine setup entirely.
     """
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        _run_with_connection(connection)
+        return
+
+    from sqlalchemy import engine_from_config, pool
+
     connectable = engine_from_config(
         config.get_section(config.config_ini_section, {}),
         prefix="sqlalchemy.",
         poolclass=pool.NullPool,
     )
-
-    with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
-
-        with context.begin_transaction():
-            context.run_migrations()
+    try:
+        with connectable.connect() as connection:
+            _warn_invalid_indexes(connection)
+            _run_with_connection(connection)
+    finally:
+        connectable.dispose()
 
 
 if context.is_offline_mode():
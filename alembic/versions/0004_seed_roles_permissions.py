@@ -7,7 +7,9 @@ Create Date: 2026-02-24
 
 from typing import Sequence, Union
 
+import sqlalchemy as sa
 from alembic import op
+from sqlalchemy.dialects import postgresql
 
 revision: str = "0004"
 down_revision: Union[str, None] = "0003"
@@ -60,61 +62,79 @@ PERMISSIONS = [
 FULL_ACCESS_ROLES = ["admin", "ceo"]
 
 
+def _text_array(name: str, values) -> sa.BindParameter:
+    """Bind a list of seed strings as a single text[] parameter."""
+    return sa.bindparam(name, list(values), type_=postgresql.ARRAY(sa.Text()))
+
+
 def upgrade() -> None:
     # ── 1. Seed roles ────────────────────────────────────────────────────────
-    for name, description in ROLES:
-        op.execute(f"""
+    op.execute(
+        sa.text("""
             INSERT INTO eb_roles (id, name, description, created_at)
-            SELECT gen_random_uuid(), '{name}', '{description}', now()
+            SELECT gen_random_uuid(), v.name, v.description, now()
+            FROM unnest(:names, :descriptions) AS v(name, description)
             WHERE NOT EXISTS (
-                SELECT 1 FROM eb_roles WHERE name = '{name}'
+                SELECT 1 FROM eb_roles WHERE name = v.name
             )
-        """)
+        """).bindparams(
+            _text_array("names", (name for name, _ in ROLES)),
+            _text_array("descriptions", (description for _, description in ROLES)),
+        )
+    )
 
     # ── 2. Seed permissions ──────────────────────────────────────────────────
-    for resource, action in PERMISSIONS:
-        desc = f"{resource}:{action}"
-        op.execute(f"""
+    op.execute(
+        sa.text("""
             INSERT INTO eb_permissions (id, resource, action, description)
-            SELECT gen_random_uuid(), '{resource}', '{action}', '{desc}'
+            SELECT gen_random_uuid(), v.resource, v.action, v.resource || ':' || v.action
+            FROM unnest(:resources, :actions) AS v(resource, action)
             WHERE NOT EXISTS (
                 SELECT 1 FROM eb_permissions
-                WHERE resource = '{resource}' AND action = '{action}'
+                WHERE resource = v.resource AND action = v.action
             )
-        """)
+        """).bindparams(
+            _text_array("resources", (resource for resource, _ in PERMISSIONS)),
+            _text_array("actions", (action for _, action in PERMISSIONS)),
+        )
+    )
 
     # ── 3. Grant all permissions to admin and ceo roles ──────────────────────
-    for role_name in FULL_ACCESS_ROLES:
-        op.execute(f"""
+    op.execute(
+        sa.text("""
             INSERT INTO eb_role_permissions (role_id, permission_id)
             SELECT r.id, p.id
             FROM eb_roles r
             CROSS JOIN eb_permissions p
-            WHERE r.name = '{role_name}'
-              AND NOT EXISTS (
-                  SELECT 1 FROM eb_role_permissions rp
-                  WHERE rp.role_id = r.id AND rp.permission_id = p.id
-              )
-        """)
+            WHERE r.name = ANY(:roles)
+            ON CONFLICT (role_id, permission_id) DO NOTHING
+        """).bindparams(_text_array("roles", FULL_ACCESS_ROLES))
+    )
 
 
 def downgrade() -> None:
     # Remove role-permission mappings for seeded roles
-    for role_name in FULL_ACCESS_ROLES:
-        op.execute(f"""
+    op.execute(
+        sa.text("""
             DELETE FROM eb_role_permissions
-            WHERE role_id = (SELECT id FROM eb_roles WHERE name = '{role_name}')
-        """)
+            WHERE role_id IN (SELECT id FROM eb_roles WHERE name = ANY(:roles))
+        """).bindparams(_text_array("roles", FULL_ACCESS_ROLES))
+    )
 
     # Remove seeded permissions
-    for resource, action in PERMISSIONS:
-        op.execute(f"""
+    op.execute(
+        sa.text("""
             DELETE FROM eb_permissions
-            WHERE resource = '{resource}' AND action = '{action}'
-        """)
+            WHERE (resource, action) IN (SELECT * FROM unnest(:resources, :actions))
+        """).bindparams(
+            _text_array("resources", (resource for resource, _ in PERMISSIONS)),
+            _text_array("actions", (action for _, action in PERMISSIONS)),
+        )
+    )
 
     # Remove seeded roles
-    for name, _ in ROLES:
-        op.execute(f"""
-            DELETE FROM eb_roles WHERE name = '{name}'
-        """)
+    op.execute(
+        sa.text("DELETE FROM eb_roles WHERE name = ANY(:names)").bindparams(
+            _text_array("names", (name for name, _ in ROLES))
+        )
+    )
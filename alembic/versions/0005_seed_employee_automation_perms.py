@@ -7,7 +7,9 @@ Create Date: 2026-02-25
 
 from typing import Sequence, Union
 
+import sqlalchemy as sa
 from alembic import op
+from sqlalchemy.dialects import postgresql
 
 revision: str = "0005"
 down_revision: Union[str, None] = "0004"
@@ -19,59 +21,52 @@ ACTIONS = ["read", "create", "update", "delete"]
 
 
 def upgrade() -> None:
-    conn = op.get_bind()
-
     # Insert permissions (idempotent)
-    for action in ACTIONS:
-        conn.execute(
-            op.inline_literal(
-                f"""
-                INSERT INTO eb_permissions (resource, action)
-                SELECT '{RESOURCE}', '{action}'
-                WHERE NOT EXISTS (
-                    SELECT 1 FROM eb_permissions
-                    WHERE resource = '{RESOURCE}' AND action = '{action}'
-                )
-                """
+    op.execute(
+        sa.text("""
+            INSERT INTO eb_permissions (resource, action)
+            SELECT :resource, v.action
+            FROM unnest(:actions) AS v(action)
+            WHERE NOT EXISTS (
+                SELECT 1 FROM eb_permissions
+                WHERE resource = :resource AND action = v.action
             )
+        """).bindparams(
+            sa.bindparam("resource", RESOURCE, type_=sa.Text()),
+            sa.bindparam("actions", ACTIONS, type_=postgresql.ARRAY(sa.Text())),
         )
+    )
 
     # Grant all employee_automation permissions to admin and ceo roles
-    for role_name in ("admin", "ceo"):
-        conn.execute(
-            op.inline_literal(
-                f"""
-                INSERT INTO eb_role_permissions (role_id, permission_id)
-                SELECT r.id, p.id
-                FROM eb_roles r
-                CROSS JOIN eb_permissions p
-                WHERE r.name = '{role_name}'
-                  AND p.resource = '{RESOURCE}'
-                  AND NOT EXISTS (
-                      SELECT 1 FROM eb_role_permissions rp
-                      WHERE rp.role_id = r.id AND rp.permission_id = p.id
-                  )
-                """
-            )
+    op.execute(
+        sa.text("""
+            INSERT INTO eb_role_permissions (role_id, permission_id)
+            SELECT r.id, p.id
+            FROM eb_roles r
+            CROSS JOIN eb_permissions p
+            WHERE r.name = ANY(:roles)
+              AND p.resource = :resource
+            ON CONFLICT (role_id, permission_id) DO NOTHING
+        """).bindparams(
+            sa.bindparam("roles", ["admin", "ceo"], type_=postgresql.ARRAY(sa.Text())),
+            sa.bindparam("resource", RESOURCE, type_=sa.Text()),
         )
+    )
 
 
 def downgrade() -> None:
-    conn = op.get_bind()
     # Remove role-permission mappings
-    conn.execute(
-        op.inline_literal(
-            f"""
+    op.execute(
+        sa.text("""
             DELETE FROM eb_role_permissions
             WHERE permission_id IN (
-                SELECT id FROM eb_permissions WHERE resource = '{RESOURCE}'
+                SELECT id FROM eb_permissions WHERE resource = :resource
             )
-            """
-        )
+        """).bindparams(resource=RESOURCE)
     )
     # Remove permissions
-    conn.execute(
-        op.inline_literal(
-            f"""DELETE FROM eb_permissions WHERE resource = '{RESOURCE}'"""
+    op.execute(
+        sa.text("DELETE FROM eb_permissions WHERE resource = :resource").bindparams(
+            resource=RESOURCE
         )
     )
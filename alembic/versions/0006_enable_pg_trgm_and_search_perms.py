@@ -7,7 +7,34 @@ Revises: 0005
 revision = "0006"
 down_revision = "0005"
 
+import sqlalchemy as sa
 from alembic import op
+from sqlalchemy.dialects import postgresql
+
+NEW_RESOURCES = [
+    "search", "analytics", "ai_copilot", "utility",
+    "freelance", "push_tokens", "saved_items",
+    "leads", "attendance",
+]
+ACTIONS = ["read", "create", "update", "delete"]
+
+# (roles, resources, actions) granted on top of the admin/ceo full access
+GRANTS = [
+    # All new permissions to admin
+    (["admin"], NEW_RESOURCES, ACTIONS),
+    # Read access to search/analytics/copilot for manager and counselor
+    (["manager", "counselor"], ["search", "analytics", "ai_copilot"], ["read"]),
+    # Leads CRUD to counselor + manager (they work with leads daily)
+    (["manager", "counselor"], ["leads"], ACTIONS),
+    # Attendance read+create to all roles (everyone checks in/out)
+    (["manager", "counselor", "processor", "viewer"], ["attendance"], ["read", "create"]),
+    # Attendance update to manager (to mark check-outs for others)
+    (["manager"], ["attendance"], ["update"]),
+]
+
+
+def _text_array(name, values):
+    return sa.bindparam(name, list(values), type_=postgresql.ARRAY(sa.Text()))
 
 
 def upgrade():
@@ -18,95 +45,54 @@ def upgrade():
     op.execute("CREATE EXTENSION IF NOT EXISTS vector")
 
     # Seed permissions for new modules
-    new_resources = [
-        "search", "analytics", "ai_copilot", "utility",
-        "freelance", "push_tokens", "saved_items",
-        "leads", "attendance",
+    op.execute(
+        sa.text("""
+            INSERT INTO eb_permissions (resource, action)
+            SELECT v.resource, a.action
+            FROM unnest(:resources) AS v(resource)
+            CROSS JOIN unnest(:actions) AS a(action)
+            WHERE NOT EXISTS (
+                SELECT 1 FROM eb_permissions p WHERE p.resource = v.resource AND p.action = a.action
+            )
+        """).bindparams(_text_array("resources", NEW_RESOURCES), _text_array("actions", ACTIONS))
+    )
+
+    # Apply every grant below in one statement
+    grants = [
+        (role, resource, action)
+        for roles, resources, actions in GRANTS
+        for role in roles
+        for resource in resources
+        for action in actions
     ]
-    actions = ["read", "create", "update", "delete"]
-
-    for resource in new_resources:
-        for action in actions:
-            op.execute(f"""
-                INSERT INTO eb_permissions (resource, action)
-                SELECT '{resource}', '{action}'
-                WHERE NOT EXISTS (
-                    SELECT 1 FROM eb_permissions WHERE resource = '{resource}' AND action = '{action}'
-                )
-            """)
-
-    # Grant all new permissions to admin role
-    op.execute("""
-        INSERT INTO eb_role_permissions (role_id, permission_id)
-        SELECT r.id, p.id
-        FROM eb_roles r, eb_permissions p
-        WHERE r.name = 'admin'
-          AND p.resource IN ('search', 'analytics', 'ai_copilot', 'utility', 'freelance', 'push_tokens', 'saved_items', 'leads', 'attendance')
-          AND NOT EXISTS (
-              SELECT 1 FROM eb_role_permissions rp WHERE rp.role_id = r.id AND rp.permission_id = p.id
-          )
-    """)
-
-    # Grant read permissions to manager and counselor roles
-    op.execute("""
-        INSERT INTO eb_role_permissions (role_id, permission_id)
-        SELECT r.id, p.id
-        FROM eb_roles r, eb_permissions p
-        WHERE r.name IN ('manager', 'counselor')
-          AND p.resource IN ('search', 'analytics', 'ai_copilot')
-          AND p.action = 'read'
-          AND NOT EXISTS (
-              SELECT 1 FROM eb_role_permissions rp WHERE rp.role_id = r.id AND rp.permission_id = p.id
-          )
-    """)
-
-    # Grant leads CRUD to counselor + manager (they work with leads daily)
-    op.execute("""
-        INSERT INTO eb_role_permissions (role_id, permission_id)
-        SELECT r.id, p.id
-        FROM eb_roles r, eb_permissions p
-        WHERE r.name IN ('manager', 'counselor')
-          AND p.resource = 'leads'
-          AND NOT EXISTS (
-              SELECT 1 FROM eb_role_permissions rp WHERE rp.role_id = r.id AND rp.permission_id = p.id
-          )
-    """)
-
-    # Grant attendance read+create to all roles (everyone checks in/out)
-    op.execute("""
-        INSERT INTO eb_role_permissions (role_id, permission_id)
-        SELECT r.id, p.id
-        FROM eb_roles r, eb_permissions p
-        WHERE r.name IN ('manager', 'counselor', 'processor', 'viewer')
-          AND p.resource = 'attendance'
-          AND p.action IN ('read', 'create')
-          AND NOT EXISTS (
-              SELECT 1 FROM eb_role_permissions rp WHERE rp.role_id = r.id AND rp.permission_id = p.id
-          )
-    """)
-
-    # Grant attendance update to manager (to mark check-outs for others)
-    op.execute("""
-        INSERT INTO eb_role_permissions (role_id, permission_id)
-        SELECT r.id, p.id
-        FROM eb_roles r, eb_permissions p
-        WHERE r.name = 'manager'
-          AND p.resource = 'attendance'
-          AND p.action = 'update'
-          AND NOT EXISTS (
-              SELECT 1 FROM eb_role_permissions rp WHERE rp.role_id = r.id AND rp.permission_id = p.id
-          )
-    """)
+    op.execute(
+        sa.text("""
+            INSERT INTO eb_role_permissions (role_id, permission_id)
+            SELECT r.id, p.id
+            FROM unnest(:roles, :resources, :actions) AS g(role, resource, action)
+            JOIN eb_roles r ON r.name = g.role
+            JOIN eb_permissions p ON p.resource = g.resource AND p.action = g.action
+            ON CONFLICT (role_id, permission_id) DO NOTHING
+        """).bindparams(
+            _text_array("roles", (role for role, _, _ in grants)),
+            _text_array("resources", (resource for _, resource, _ in grants)),
+            _text_array("actions", (action for _, _, action in grants)),
+        )
+    )
 
 
 def downgrade():
-    resources = "('search', 'analytics', 'ai_copilot', 'utility', 'freelance', 'push_tokens', 'saved_items', 'leads', 'attendance')"
-
-    op.execute(f"""
-        DELETE FROM eb_role_permissions WHERE permission_id IN (
-            SELECT id FROM eb_permissions WHERE resource IN {resources}
+    op.execute(
+        sa.text("""
+            DELETE FROM eb_role_permissions WHERE permission_id IN (
+                SELECT id FROM eb_permissions WHERE resource = ANY(:resources)
+            )
+        """).bindparams(_text_array("resources", NEW_RESOURCES))
+    )
+    op.execute(
+        sa.text("DELETE FROM eb_permissions WHERE resource = ANY(:resources)").bindparams(
+            _text_array("resources", NEW_RESOURCES)
         )
-    """)
-    op.execute(f"DELETE FROM eb_permissions WHERE resource IN {resources}")
+    )
 
     op.execute("DROP EXTENSION IF EXISTS pg_trgm")
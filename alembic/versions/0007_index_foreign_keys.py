@@ -0,0 +1,87 @@
+"""Index foreign key columns that have no supporting index
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-16
+
+Postgres indexes the referenced side of a foreign key but not the
+referencing side, so joins on these columns and every delete/update of a
+parent row scan the child table. The indexes are built CONCURRENTLY outside
+the migration transaction so writes to the live tables are not blocked.
+
+If a concurrent build fails it leaves an INVALID index behind; drop it with
+DROP INDEX CONCURRENTLY <name> and re-run the upgrade.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0007"
+down_revision: Union[str, None] = "0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column) for every FK column not already covered by an index
+FK_COLUMNS = [
+    ("agent_endpoints", "profile_id"),
+    ("attendance", "employee_id"),
+    ("campuses", "university_id"),
+    ("cities", "country_id"),
+    ("eb_action_drafts", "approved_by"),
+    ("eb_action_runs", "action_draft_id"),
+    ("eb_ai_artifacts", "created_by"),
+    ("eb_applications", "case_id"),
+    ("eb_call_analyses", "call_event_id"),
+    ("eb_call_analyses", "file_ingestion_id"),
+    ("eb_cases", "assigned_counselor_id"),
+    ("eb_cases", "assigned_processor_id"),
+    ("eb_cases", "assigned_visa_officer_id"),
+    ("eb_documents", "uploaded_by"),
+    ("eb_documents", "verified_by"),
+    ("eb_employee_goals", "created_by"),
+    ("eb_employee_goals", "employee_id"),
+    ("eb_employee_patterns", "employee_id"),
+    ("eb_employee_schedules", "approved_by"),
+    ("eb_employee_schedules", "employee_id"),
+    ("eb_file_ingestions", "employee_id"),
+    ("eb_file_ingestions", "uploaded_by"),
+    ("eb_performance_reviews", "employee_id"),
+    ("eb_performance_reviews", "reviewer_id"),
+    ("eb_role_permissions", "permission_id"),
+    ("eb_students", "assigned_processor_id"),
+    ("eb_tasks", "created_by"),
+    ("eb_training_records", "assigned_by"),
+    ("eb_training_records", "employee_id"),
+    ("eb_user_roles", "role_id"),
+    ("eb_work_logs", "employee_id"),
+    ("eb_work_logs", "event_id"),
+    ("eb_workflow_instances", "workflow_definition_id"),
+    ("freelance_managers", "profile_id"),
+    ("freelancers", "creator_id"),
+    ("jobs", "job_profile_id"),
+    ("universities", "city_id"),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table, column in FK_COLUMNS:
+            op.create_index(
+                f"ix_{table}_{column}",
+                table,
+                [column],
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table, column in FK_COLUMNS:
+            op.drop_index(
+                f"ix_{table}_{column}",
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
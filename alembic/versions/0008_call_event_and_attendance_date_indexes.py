@@ -0,0 +1,47 @@
+"""Index call_events and attendance date lookups
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-16
+
+call_events.call_date and attendance.date stay TEXT (the Flutter apps write
+them in more than one format), but every lookup on them is an equality match
+on the stored string, which a plain btree serves. call_start_time grows with
+insertion order, so a BRIN index covers time-range scans at a fraction of a
+btree's size.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0008"
+down_revision: Union[str, None] = "0007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index name, table, columns, access method)
+INDEXES = [
+    ("ix_call_events_call_date", "call_events", ["call_date"], "btree"),
+    ("ix_call_events_call_start_time_brin", "call_events", ["call_start_time"], "brin"),
+    ("ix_attendance_date", "attendance", ["date"], "btree"),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns, using in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                postgresql_using=using,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
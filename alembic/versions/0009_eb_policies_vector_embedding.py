@@ -0,0 +1,63 @@
+"""Store eb_policies.embedding as vector(1536) with an HNSW index
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-16
+
+Embeddings come from text-embedding-3-small (1536 dimensions). As TEXT they
+cannot be compared in the database or indexed for nearest-neighbour search.
+Existing values are pgvector text literals, so they cast in place.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from pgvector.sqlalchemy import Vector
+
+revision: str = "0009"
+down_revision: Union[str, None] = "0008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+EMBEDDING_DIM = 1536
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS vector")
+    op.alter_column(
+        "eb_policies",
+        "embedding",
+        type_=Vector(EMBEDDING_DIM),
+        existing_type=sa.Text(),
+        existing_nullable=True,
+        postgresql_using=f"embedding::vector({EMBEDDING_DIM})",
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_eb_policies_embedding_hnsw",
+            "eb_policies",
+            ["embedding"],
+            postgresql_using="hnsw",
+            postgresql_ops={"embedding": "vector_cosine_ops"},
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_eb_policies_embedding_hnsw",
+            table_name="eb_policies",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.alter_column(
+        "eb_policies",
+        "embedding",
+        type_=sa.Text(),
+        existing_type=Vector(EMBEDDING_DIM),
+        existing_nullable=True,
+        postgresql_using="embedding::text",
+    )
@@ -0,0 +1,29 @@
+"""Pack call_events primary key pages fully
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-16
+
+call_events is insert-only and keyed by an ever-increasing identity, so new
+keys always land on the rightmost leaf of its primary key. Btree leaves those
+pages 90% full by default to make room for inserts that never come; at 100
+the index stays ~10% smaller. The setting applies to pages split from now
+on, so no rebuild is needed.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0010"
+down_revision: Union[str, None] = "0009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("ALTER INDEX IF EXISTS call_events_pkey SET (fillfactor = 100)")
+
+
+def downgrade() -> None:
+    op.execute("ALTER INDEX IF EXISTS call_events_pkey RESET (fillfactor)")
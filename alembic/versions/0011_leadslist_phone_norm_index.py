@@ -0,0 +1,40 @@
+"""Index leadslist.phone_norm
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-16
+
+phone_norm is filled in by the leadslist_norm_maint trigger and is what
+duplicate detection and lookup-by-phone match on; without an index every
+lead insert scans the table.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0011"
+down_revision: Union[str, None] = "0010"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_leadslist_phone_norm",
+            "leadslist",
+            ["phone_norm"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_leadslist_phone_norm",
+            table_name="leadslist",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
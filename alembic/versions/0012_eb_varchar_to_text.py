@@ -0,0 +1,85 @@
+"""Use TEXT instead of VARCHAR(n) on eb_* tables
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2026-10-16
+
+VARCHAR(n) and TEXT share storage, so the only thing a length modifier adds
+is a check on every write and an ALTER whenever the limit needs to change.
+varchar -> text is binary-coercible: Postgres swaps the type in the catalog
+without rewriting the table or its indexes. Limits that are real business
+rules (email and phone) are kept as CHECK constraints. They are added NOT
+VALID and validated after the type changes commit, so the scan of existing
+rows runs under SHARE UPDATE EXCLUSIVE instead of the ALTER's ACCESS
+EXCLUSIVE lock.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0012"
+down_revision: Union[str, None] = "0011"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# table -> {column: previous VARCHAR length}
+VARCHAR_COLUMNS = {
+    "eb_users": {
+        "email": 255, "phone": 20, "full_name": 255, "hashed_password": 255,
+        "department": 100, "caller_id": 50, "location": 100,
+    },
+    "eb_roles": {"name": 50},
+    "eb_permissions": {"resource": 50, "action": 50},
+    "eb_students": {
+        "full_name": 255, "email": 255, "phone": 20, "nationality": 100,
+        "passport_number": 50, "education_level": 50,
+        "english_test_type": 20, "english_test_score": 20,
+    },
+    "eb_notifications": {"title": 255, "notification_type": 30, "entity_type": 30},
+    "eb_tasks": {
+        "entity_type": 30, "title": 255, "task_type": 30, "priority": 20, "status": 20,
+    },
+    "eb_documents": {
+        "entity_type": 30, "document_type": 50, "file_name": 255, "file_key": 500,
+        "mime_type": 100,
+    },
+    "eb_action_drafts": {
+        "action_type": 50, "entity_type": 30, "created_by_type": 10, "status": 30,
+    },
+}
+
+# (table, column, max length) kept as CHECK constraints
+LENGTH_CHECKS = [
+    ("eb_users", "email", 255),
+    ("eb_users", "phone", 20),
+    ("eb_students", "email", 255),
+    ("eb_students", "phone", 20),
+]
+
+
+def upgrade() -> None:
+    for table, columns in VARCHAR_COLUMNS.items():
+        alters = ", ".join(f"ALTER COLUMN {col} TYPE text" for col in columns)
+        op.execute(f"ALTER TABLE {table} {alters}")
+
+    for table, column, length in LENGTH_CHECKS:
+        op.execute(
+            f"ALTER TABLE {table} ADD CONSTRAINT ck_{table}_{column}_length "
+            f"CHECK (char_length({column}) <= {length}) NOT VALID"
+        )
+
+    with op.get_context().autocommit_block():
+        for table, column, _ in LENGTH_CHECKS:
+            op.execute(f"ALTER TABLE {table} VALIDATE CONSTRAINT ck_{table}_{column}_length")
+
+
+def downgrade() -> None:
+    for table, column, _ in LENGTH_CHECKS:
+        op.execute(f"ALTER TABLE {table} DROP CONSTRAINT IF EXISTS ck_{table}_{column}_length")
+
+    for table, columns in VARCHAR_COLUMNS.items():
+        alters = ", ".join(
+            f"ALTER COLUMN {col} TYPE varchar({length})" for col, length in columns.items()
+        )
+        op.execute(f"ALTER TABLE {table} {alters}")
@@ -0,0 +1,70 @@
+"""Composite indexes matching the list endpoints' filters and sort order
+
+Revision ID: 0013
+Revises: 0012
+Create Date: 2026-10-16
+
+Each list endpoint filters on a fixed set of columns and then sorts by time;
+with only single-column indexes Postgres has to fetch every matching row and
+sort it before applying LIMIT. Indexes that end in the sort column let it read
+the first page straight off the index. The single-column indexes they replace
+are a prefix of the new ones and are dropped.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0013"
+down_revision: Union[str, None] = "0012"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index name, table, columns)
+INDEXES = [
+    # events.service.list_events: entity filter, newest first
+    ("ix_eb_events_entity_created", "eb_events",
+     ["entity_type", "entity_id", sa.text("created_at DESC")]),
+    # tasks.service.list_tasks: per-assignee, optional status, by due date
+    ("ix_eb_tasks_assigned_status_due", "eb_tasks",
+     ["assigned_to", "status", sa.text("due_at NULLS LAST")]),
+    # notifications.service: per-user inbox, unread count and mark_all_read
+    ("ix_eb_notifications_user_read_created", "eb_notifications",
+     ["user_id", "is_read", sa.text("created_at DESC")]),
+    # documents.service.list_documents: entity filter, newest first
+    ("ix_eb_documents_entity_created", "eb_documents",
+     ["entity_type", "entity_id", sa.text("created_at DESC")]),
+    # ai_copilot: a student's most recent calls
+    ("ix_call_events_caller_phone_created", "call_events",
+     ["caller_phone_norm", sa.text("created_at DESC")]),
+    # call stats and employee metrics: calls made by an agent
+    ("ix_call_events_agent_phone", "call_events", ["agent_phone_norm"]),
+]
+
+# Superseded single-column indexes from the baseline: (name, table, columns)
+REPLACED = [
+    ("ix_eb_events_entity", "eb_events", ["entity_type", "entity_id"]),
+    ("ix_eb_tasks_assigned", "eb_tasks", ["assigned_to"]),
+    ("ix_eb_notifications_user", "eb_notifications", ["user_id"]),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name, table, columns, postgresql_concurrently=True, if_not_exists=True
+            )
+        for name, table, _ in REPLACED:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in REPLACED:
+            op.create_index(
+                name, table, columns, postgresql_concurrently=True, if_not_exists=True
+            )
+        for name, table, _ in INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,43 @@
+"""Leave free space on the lead, task, student and conversation tables
+
+Revision ID: 0014
+Revises: 0013
+Create Date: 2026-10-17
+
+leadslist rows are edited all day (follow_up, heat_status, info_progress,
+call_summary), chat_conversations is touched on every message, and
+eb_tasks/eb_students are edited in place far more than they grow. Updates
+that leave the indexed columns alone stay HOT once there is room on the page;
+the ones that do change an indexed column (task status/due_at, lead
+status/assigned_to) still keep the new row version on the same page. These
+tables also take a steady stream of inserts, so 85 keeps most of each page
+filled. Insert-only tables (call_events, eb_events, eb_ai_artifacts) stay at
+the default of 100.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0014"
+down_revision: Union[str, None] = "0013"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# table -> fillfactor
+FILLFACTORS = {
+    "leadslist": 85,
+    "eb_tasks": 85,
+    "eb_students": 85,
+    "chat_conversations": 85,
+}
+
+
+def upgrade() -> None:
+    for table, fillfactor in FILLFACTORS.items():
+        op.execute(f"ALTER TABLE {table} SET (fillfactor = {fillfactor})")
+
+
+def downgrade() -> None:
+    for table in FILLFACTORS:
+        op.execute(f"ALTER TABLE {table} RESET (fillfactor)")
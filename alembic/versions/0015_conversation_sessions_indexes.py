@@ -0,0 +1,41 @@
+"""Index conversation_sessions lookups
+
+Revision ID: 0015
+Revises: 0014
+Create Date: 2026-10-16
+
+ig_sessions.service.list_sessions filters by ig_user_id or status and pages
+newest first; conversation_sessions had no index beyond its primary key.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0015"
+down_revision: Union[str, None] = "0014"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index name, table, columns)
+INDEXES = [
+    ("ix_conversation_sessions_ig_user_created", "conversation_sessions",
+     ["ig_user_id", sa.text("created_at DESC")]),
+    ("ix_conversation_sessions_status_created", "conversation_sessions",
+     ["status", sa.text("created_at DESC")]),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name, table, columns, postgresql_concurrently=True, if_not_exists=True
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
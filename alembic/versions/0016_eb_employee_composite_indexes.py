@@ -0,0 +1,78 @@
+"""Composite indexes for employee automation, workflow and case queries
+
+Revision ID: 0016
+Revises: 0015
+Create Date: 2026-10-16
+
+Equality keys first, then the range/sort key, so one index serves both the
+filter and the ORDER BY of each query. Single-column FK indexes that become
+a prefix of a new index are dropped.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0016"
+down_revision: Union[str, None] = "0015"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index name, table, columns)
+INDEXES = [
+    # employee_automation.list_employee_metrics / analytics.employee_trends
+    ("ix_eb_employee_metrics_employee_period", "eb_employee_metrics",
+     ["employee_id", "period_type", sa.text("period_start DESC")]),
+    # analytics.team_performance: latest period_start per period_type
+    ("ix_eb_employee_metrics_period", "eb_employee_metrics",
+     ["period_type", sa.text("period_start DESC")]),
+    # employee_automation.list_employee_goals
+    ("ix_eb_employee_goals_employee_status", "eb_employee_goals",
+     ["employee_id", "status", sa.text("period_end DESC")]),
+    # compute_employee_metrics: an employee's analyses within a period
+    ("ix_eb_call_analyses_employee_analyzed", "eb_call_analyses",
+     ["employee_id", "analyzed_at"]),
+    # employee_automation.list_work_logs
+    ("ix_eb_work_logs_employee_started", "eb_work_logs",
+     ["employee_id", sa.text("started_at DESC")]),
+    # employee_automation.list_file_ingestions
+    ("ix_eb_file_ingestions_employee_created", "eb_file_ingestions",
+     ["employee_id", sa.text("created_at DESC")]),
+    # workflows.list_instances
+    ("ix_eb_workflow_instances_entity_created", "eb_workflow_instances",
+     ["entity_type", "entity_id", sa.text("created_at DESC")]),
+    # cases.list_cases: a counselor's cases, optionally by stage
+    ("ix_eb_cases_counselor_stage", "eb_cases",
+     ["assigned_counselor_id", "current_stage"]),
+]
+
+# Indexes made redundant by the ones above: (name, table, columns)
+REPLACED = [
+    ("ix_eb_employee_metrics_employee", "eb_employee_metrics", ["employee_id"]),
+    ("ix_eb_employee_goals_employee_id", "eb_employee_goals", ["employee_id"]),
+    ("ix_eb_call_analyses_employee", "eb_call_analyses", ["employee_id"]),
+    ("ix_eb_work_logs_employee_id", "eb_work_logs", ["employee_id"]),
+    ("ix_eb_file_ingestions_employee_id", "eb_file_ingestions", ["employee_id"]),
+    ("ix_eb_cases_assigned_counselor_id", "eb_cases", ["assigned_counselor_id"]),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name, table, columns, postgresql_concurrently=True, if_not_exists=True
+            )
+        for name, table, _ in REPLACED:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in REPLACED:
+            op.create_index(
+                name, table, columns, postgresql_concurrently=True, if_not_exists=True
+            )
+        for name, table, _ in INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
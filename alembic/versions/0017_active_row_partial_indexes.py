@@ -0,0 +1,51 @@
+"""Partial indexes over active cases and employee patterns
+
+Revision ID: 0017
+Revises: 0016
+Create Date: 2026-10-16
+
+Auto-assignment counts each counselor's active cases on every new student,
+and case lookups by student only ever want the active one. Closed cases
+accumulate forever, so indexing just the is_active rows keeps these indexes
+small and lets the workload counts run as index-only scans.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "0017"
+down_revision: Union[str, None] = "0016"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index name, table, columns, predicate)
+INDEXES = [
+    # auto_assign.score_counselors: active cases per counselor
+    ("ix_eb_cases_active_counselor", "eb_cases", ["assigned_counselor_id"], "is_active"),
+    # auto_assign / lead_intake: a student's active case
+    ("ix_eb_cases_active_student", "eb_cases", ["student_id"], "is_active"),
+    # employee_automation.list_employee_patterns(is_active=True)
+    ("ix_eb_employee_patterns_active", "eb_employee_patterns",
+     ["employee_id", sa.text("detected_at DESC")], "is_active"),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns, where in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                postgresql_where=sa.text(where),
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,46 @@
+"""BRIN indexes on insertion-ordered created_at columns
+
+Revision ID: 0018
+Revises: 0017
+Create Date: 2026-10-16
+
+The metrics task counts each agent's call_events within a period and the
+lead dashboards count leadslist rows created within a date range. Both
+tables are filled in created_at order, so a BRIN index (min/max per block
+range) lets those range predicates skip most of the heap for a few pages of
+index, and combines with the agent/assignee btrees in a bitmap AND.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0018"
+down_revision: Union[str, None] = "0017"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index name, table, column)
+INDEXES = [
+    ("ix_call_events_created_at_brin", "call_events", "created_at"),
+    ("ix_leadslist_created_at_brin", "leadslist", "created_at"),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, column in INDEXES:
+            op.create_index(
+                name,
+                table,
+                [column],
+                postgresql_using="brin",
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
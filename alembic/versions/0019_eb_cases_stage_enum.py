@@ -0,0 +1,61 @@
+"""Store eb_cases.current_stage as a native enum
+
+Revision ID: 0019
+Revises: 0018
+Create Date: 2026-10-16
+
+current_stage only ever holds one of cases.models.VALID_STAGES (the service
+layer rejects anything else). As an enum each value is a fixed 4 bytes
+instead of a varlena string, and the stage indexes shrink accordingly.
+The list is copied here, not imported, so this revision keeps describing
+the schema it created even after VALID_STAGES changes.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0019"
+down_revision: Union[str, None] = "0018"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+STAGES = [
+    "initial_consultation",
+    "documents_pending",
+    "documents_collected",
+    "university_shortlisted",
+    "applied",
+    "offer_received",
+    "offer_accepted",
+    "visa_processing",
+    "visa_approved",
+    "visa_rejected",
+    "travel_booked",
+    "completed",
+    "on_hold",
+    "cancelled",
+]
+
+
+def upgrade() -> None:
+    labels = ", ".join(f"'{stage}'" for stage in STAGES)
+    op.execute(f"CREATE TYPE case_stage AS ENUM ({labels})")
+    # The text default cannot be cast in place, so it is dropped and re-set
+    # around the type change.
+    op.execute(
+        "ALTER TABLE eb_cases "
+        "ALTER COLUMN current_stage DROP DEFAULT, "
+        "ALTER COLUMN current_stage TYPE case_stage USING current_stage::case_stage, "
+        "ALTER COLUMN current_stage SET DEFAULT 'initial_consultation'"
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "ALTER TABLE eb_cases "
+        "ALTER COLUMN current_stage DROP DEFAULT, "
+        "ALTER COLUMN current_stage TYPE varchar(50) USING current_stage::text, "
+        "ALTER COLUMN current_stage SET DEFAULT 'initial_consultation'"
+    )
+    op.execute("DROP TYPE case_stage")
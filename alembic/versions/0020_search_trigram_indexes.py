@@ -0,0 +1,57 @@
+"""Trigram GIN indexes on the unified-search text columns
+
+Revision ID: 0020
+Revises: 0019
+Create Date: 2026-10-16
+
+hybrid_search and quick_search match every search column with
+``col ILIKE '%q%'`` or ``col % q``. Without an index each of those is a
+sequential scan of the whole table; a gin_trgm_ops index serves both
+operators, and with every OR arm indexed the planner can answer the search
+with a BitmapOr instead of reading the heap. eb_cases is left out: its search
+columns are a short varchar and an enum, and the table is small.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0020"
+down_revision: Union[str, None] = "0019"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Mirrors search_columns in app.modules.search.service.ENTITY_CONFIGS
+SEARCH_COLUMNS = {
+    "courses": ["program_name", "university", "country"],
+    "leadslist": ["name", "email"],
+    "eb_students": ["full_name", "email", "phone"],
+    "eb_policies": ["title", "category", "content"],
+}
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table, columns in SEARCH_COLUMNS.items():
+            for column in columns:
+                op.create_index(
+                    f"ix_{table}_{column}_trgm",
+                    table,
+                    [column],
+                    postgresql_using="gin",
+                    postgresql_ops={column: "gin_trgm_ops"},
+                    postgresql_concurrently=True,
+                    if_not_exists=True,
+                )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table, columns in SEARCH_COLUMNS.items():
+            for column in columns:
+                op.drop_index(
+                    f"ix_{table}_{column}_trgm",
+                    table_name=table,
+                    postgresql_concurrently=True,
+                    if_exists=True,
+                )
@@ -0,0 +1,81 @@
+"""Full-text search vectors for call transcriptions and courses
+
+Revision ID: 0021
+Revises: 0020
+Create Date: 2026-10-16
+
+eb_call_analyses gains transcription_tsv, a stored generated tsvector over
+the transcription, so tokenising and stemming happen once at write time and
+a keyword search is a GIN lookup ranked with ts_rank instead of an ILIKE
+scan over every transcript.
+
+courses is a legacy table and already carries search_vector, which
+hybrid_search matches with @@ but which had no index. The column is not
+part of the 0001 baseline, so the index is only created where it exists.
+Offline (--sql) there is no connection to check, and CREATE INDEX
+CONCURRENTLY cannot be wrapped in a DO block, so the SQL script leaves this
+index out; run the migration online against databases that have the column.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision: str = "0021"
+down_revision: Union[str, None] = "0020"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _has_column(table: str, column: str) -> bool:
+    if op.get_context().as_sql:
+        return False
+    return column in {c["name"] for c in sa.inspect(op.get_bind()).get_columns(table)}
+
+
+def upgrade() -> None:
+    op.add_column(
+        "eb_call_analyses",
+        sa.Column(
+            "transcription_tsv",
+            postgresql.TSVECTOR(),
+            sa.Computed("to_tsvector('english', coalesce(transcription, ''))", persisted=True),
+        ),
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_eb_call_analyses_transcription_tsv",
+            "eb_call_analyses",
+            ["transcription_tsv"],
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        if _has_column("courses", "search_vector"):
+            op.create_index(
+                "ix_courses_search_vector",
+                "courses",
+                ["search_vector"],
+                postgresql_using="gin",
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_courses_search_vector",
+            table_name="courses",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_eb_call_analyses_transcription_tsv",
+            table_name="eb_call_analyses",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.drop_column("eb_call_analyses", "transcription_tsv")
@@ -0,0 +1,54 @@
+"""Narrow eb_employee_metrics counters to smallint and scores to real
+
+Revision ID: 0022
+Revises: 0021
+Create Date: 2026-10-16
+
+The per-period counters never get near the integer range and the scores
+and averages only need a couple of significant decimals, so smallint
+(2 bytes) and real (4 bytes) replace integer and double precision. That
+takes roughly a third off every row, and with it the pages read when an
+employee's metric history is scanned or aggregated. All columns change in
+one ALTER TABLE so the table is rewritten once.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0022"
+down_revision: Union[str, None] = "0021"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# integer -> smallint
+COUNT_COLUMNS = [
+    "calls_made", "calls_received", "calls_missed",
+    "leads_contacted", "leads_converted", "new_students_onboarded",
+    "cases_progressed", "cases_closed", "applications_submitted",
+    "documents_processed", "documents_verified",
+    "days_present", "days_absent", "days_late",
+    "tasks_completed", "tasks_overdue",
+]
+
+# double precision -> real
+SCORE_COLUMNS = [
+    "total_call_duration_mins", "avg_call_duration_mins",
+    "avg_call_quality_score", "avg_call_sentiment",
+    "total_hours_worked", "avg_task_completion_hours",
+    "ai_performance_score", "ai_efficiency_score", "ai_quality_score",
+]
+
+
+def _alter(count_type: str, score_type: str) -> None:
+    alters = [f"ALTER COLUMN {col} TYPE {count_type}" for col in COUNT_COLUMNS]
+    alters += [f"ALTER COLUMN {col} TYPE {score_type}" for col in SCORE_COLUMNS]
+    op.execute(f"ALTER TABLE eb_employee_metrics {', '.join(alters)}")
+
+
+def upgrade() -> None:
+    _alter("smallint", "real")
+
+
+def downgrade() -> None:
+    _alter("integer", "double precision")
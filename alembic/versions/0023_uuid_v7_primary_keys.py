@@ -0,0 +1,89 @@
+"""Default eb_* primary keys to time-ordered UUIDv7
+
+Revision ID: 0023
+Revises: 0022
+Create Date: 2026-10-16
+
+gen_random_uuid() produces v4 ids, so every insert lands on a random leaf
+of the primary-key B-tree (and of every index on a column referencing it),
+dirtying pages all over the index. A v7 id leads with a millisecond
+timestamp, so new rows append to the right-hand edge instead.
+
+Postgres 17 has no built-in v7 generator and pg_uuidv7 is not available on
+every host, so uuid_generate_v7() is defined here in SQL: a v4 id with its
+first 48 bits overwritten by the Unix time in milliseconds and the version
+nibble set to 7. The ORM generates ids client-side with app.core.ids.uuid7,
+this default covers rows inserted by raw SQL. Existing v4 ids are left as
+they are. Legacy tables (attendance, conversation_sessions, dm_templates)
+keep their defaults.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0023"
+down_revision: Union[str, None] = "0022"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = [
+    "eb_action_drafts",
+    "eb_action_runs",
+    "eb_ai_artifacts",
+    "eb_applications",
+    "eb_call_analyses",
+    "eb_cases",
+    "eb_documents",
+    "eb_employee_goals",
+    "eb_employee_metrics",
+    "eb_employee_patterns",
+    "eb_employee_schedules",
+    "eb_events",
+    "eb_file_ingestions",
+    "eb_notifications",
+    "eb_performance_reviews",
+    "eb_permissions",
+    "eb_policies",
+    "eb_refresh_tokens",
+    "eb_roles",
+    "eb_students",
+    "eb_tasks",
+    "eb_training_records",
+    "eb_users",
+    "eb_work_logs",
+    "eb_workflow_definitions",
+    "eb_workflow_instances",
+]
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE OR REPLACE FUNCTION uuid_generate_v7() RETURNS uuid AS $$
+            SELECT encode(
+                set_bit(
+                    set_bit(
+                        overlay(
+                            uuid_send(gen_random_uuid())
+                            PLACING substring(
+                                int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint)
+                                FROM 3
+                            )
+                            FROM 1 FOR 6
+                        ),
+                        52, 1
+                    ),
+                    53, 1
+                ),
+                'hex'
+            )::uuid
+        $$ LANGUAGE sql VOLATILE PARALLEL SAFE
+    """)
+    for table in TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id SET DEFAULT uuid_generate_v7()")
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id SET DEFAULT gen_random_uuid()")
+    op.execute("DROP FUNCTION IF EXISTS uuid_generate_v7()")
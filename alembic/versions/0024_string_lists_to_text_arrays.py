@@ -0,0 +1,71 @@
+"""Store AI string lists as text[] instead of JSONB
+
+Revision ID: 0024
+Revises: 0023
+Create Date: 2026-10-16
+
+eb_call_analyses.topics/key_phrases and the eb_performance_reviews
+ai_strengths/ai_improvements/ai_recommendations columns only ever hold flat
+lists of strings. text[] stores them without JSONB's per-element headers and
+is read back without parsing, and a GIN index on topics answers
+``topics @> ARRAY[...]`` for the call-analysis topic filter.
+
+ALTER ... TYPE cannot take a subquery, so the JSONB -> text[] conversion goes
+through a session-local helper in pg_temp. Non-array values are kept as a
+one-element array of their text.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0024"
+down_revision: Union[str, None] = "0023"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNS = {
+    "eb_call_analyses": ["topics", "key_phrases"],
+    "eb_performance_reviews": ["ai_strengths", "ai_improvements", "ai_recommendations"],
+}
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE FUNCTION pg_temp.jsonb_to_text_array(value jsonb) RETURNS text[] AS $$
+            SELECT CASE
+                WHEN jsonb_typeof(value) = 'array' THEN ARRAY(SELECT jsonb_array_elements_text(value))
+                WHEN jsonb_typeof(value) <> 'null' THEN ARRAY[value #>> '{}']
+            END
+        $$ LANGUAGE sql IMMUTABLE
+    """)
+    for table, columns in COLUMNS.items():
+        alters = ", ".join(
+            f"ALTER COLUMN {col} TYPE text[] USING pg_temp.jsonb_to_text_array({col})"
+            for col in columns
+        )
+        op.execute(f"ALTER TABLE {table} {alters}")
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_eb_call_analyses_topics",
+            "eb_call_analyses",
+            ["topics"],
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_eb_call_analyses_topics",
+            table_name="eb_call_analyses",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+    for table, columns in COLUMNS.items():
+        alters = ", ".join(f"ALTER COLUMN {col} TYPE jsonb USING to_jsonb({col})" for col in columns)
+        op.execute(f"ALTER TABLE {table} {alters}")
@@ -0,0 +1,89 @@
+"""NOT NULL on eb_* columns that already have a server default
+
+Revision ID: 0025
+Revises: 0024
+Create Date: 2026-10-16
+
+Counters, flags and status columns all carry a server default but were left
+nullable, so every reader had to treat NULL as a second "zero"/"false" and
+the planner could not assume a value. Existing NULLs are backfilled with the
+column default, then the columns are made NOT NULL. Counters also get a
+non-negative CHECK.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0025"
+down_revision: Union[str, None] = "0024"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# table -> {column: server default used to backfill NULLs}
+DEFAULTED_COLUMNS = {
+    "eb_users": {"is_active": "true"},
+    "eb_workflow_definitions": {"is_active": "true"},
+    "eb_students": {"work_experience_years": "0"},
+    "eb_notifications": {"notification_type": "'general'", "is_read": "false"},
+    "eb_tasks": {"task_type": "'general'", "priority": "'normal'", "status": "'pending'"},
+    "eb_documents": {"is_verified": "false"},
+    "eb_action_drafts": {
+        "created_by_type": "'user'", "status": "'pending_approval'", "requires_approval": "true",
+    },
+    "eb_policies": {"is_active": "true", "version": "1"},
+    "eb_employee_metrics": {
+        col: "0"
+        for col in (
+            "calls_made", "calls_received", "calls_missed",
+            "total_call_duration_mins", "avg_call_duration_mins",
+            "leads_contacted", "leads_converted", "new_students_onboarded",
+            "cases_progressed", "cases_closed", "applications_submitted",
+            "documents_processed", "documents_verified",
+            "days_present", "days_absent", "days_late",
+            "total_hours_worked", "tasks_completed", "tasks_overdue",
+        )
+    },
+    "eb_employee_goals": {
+        "current_value": "0", "unit": "'count'", "progress_percentage": "0", "auto_track": "true",
+    },
+    "eb_employee_patterns": {"is_active": "true"},
+    "eb_employee_schedules": {"break_minutes": "60", "is_working_day": "true", "status": "'active'"},
+    "eb_cases": {
+        "case_type": "'study_abroad'", "current_stage": "'initial_consultation'",
+        "priority": "'normal'", "is_active": "true",
+    },
+    "eb_action_runs": {"status": "'started'", "retry_count": "0"},
+    "eb_applications": {"status": "'draft'"},
+}
+
+# table -> counters that can never go below zero
+NON_NEGATIVE = {
+    "eb_students": ["work_experience_years"],
+    "eb_employee_metrics": list(DEFAULTED_COLUMNS["eb_employee_metrics"]),
+    "eb_employee_schedules": ["break_minutes"],
+    "eb_action_runs": ["retry_count"],
+}
+
+
+def upgrade() -> None:
+    for table, columns in DEFAULTED_COLUMNS.items():
+        assignments = ", ".join(f"{col} = COALESCE({col}, {default})" for col, default in columns.items())
+        any_null = " OR ".join(f"{col} IS NULL" for col in columns)
+        op.execute(f"UPDATE {table} SET {assignments} WHERE {any_null}")
+
+        alters = ", ".join(f"ALTER COLUMN {col} SET NOT NULL" for col in columns)
+        op.execute(f"ALTER TABLE {table} {alters}")
+
+    for table, columns in NON_NEGATIVE.items():
+        condition = " AND ".join(f"{col} >= 0" for col in columns)
+        op.execute(f"ALTER TABLE {table} ADD CONSTRAINT ck_{table}_non_negative CHECK ({condition})")
+
+
+def downgrade() -> None:
+    for table in NON_NEGATIVE:
+        op.execute(f"ALTER TABLE {table} DROP CONSTRAINT IF EXISTS ck_{table}_non_negative")
+
+    for table, columns in DEFAULTED_COLUMNS.items():
+        alters = ", ".join(f"ALTER COLUMN {col} DROP NOT NULL" for col in columns)
+        op.execute(f"ALTER TABLE {table} {alters}")
@@ -0,0 +1,58 @@
+"""Leave free space on update-heavy tables for HOT updates
+
+Revision ID: 0026
+Revises: 0025
+Create Date: 2026-10-17
+
+These tables are updated far more often than they are inserted into. When a
+page is full an UPDATE must put the new row version on another page and add
+an entry to every index; with free space left on the page, an update that
+leaves the indexed columns alone can stay HOT and skip the indexes entirely.
+Updates that do change an indexed column still get an entry in every index,
+and the free space only keeps the new row version on the same page.
+
+- eb_workflow_instances (current_stage, stage_entered_at, history) and
+  lead_info (its JSONB sections) change only unindexed columns, so their
+  updates can stay HOT: 70.
+- conversation_sessions is rewritten on every message (messages,
+  message_count, last_message_at), none of them indexed: 70. Its status is
+  indexed, so handoffs and closes are not HOT, but they are rare next to
+  messages.
+- eb_employee_goals gets current_value/progress_percentage from the metrics
+  task, which can stay HOT. status is indexed, but it changes once per goal: 80.
+- eb_cases mostly changes current_stage and the assignees, which are all
+  indexed, so those updates are never HOT. It gets the same 85 as the tables
+  in 0014, which still keeps the new row version on the page without leaving
+  30% of it empty.
+
+The setting only affects pages written from now on; existing pages fill in as
+VACUUM frees space.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0026"
+down_revision: Union[str, None] = "0025"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# table -> fillfactor
+FILLFACTORS = {
+    "eb_cases": 85,
+    "eb_workflow_instances": 70,
+    "eb_employee_goals": 80,
+    "conversation_sessions": 70,
+    "lead_info": 70,
+}
+
+
+def upgrade() -> None:
+    for table, fillfactor in FILLFACTORS.items():
+        op.execute(f"ALTER TABLE {table} SET (fillfactor = {fillfactor})")
+
+
+def downgrade() -> None:
+    for table in FILLFACTORS:
+        op.execute(f"ALTER TABLE {table} RESET (fillfactor)")
@@ -0,0 +1,67 @@
+"""Covering indexes for the metrics and team-performance aggregates
+
+Revision ID: 0027
+Revises: 0026
+Create Date: 2026-10-17
+
+compute_employee_metrics averages quality_score/sentiment_score over an
+employee's completed analyses in a period, and analytics.team_performance
+aggregates and ranks the latest eb_employee_metrics period. Both read only a
+handful of small columns, so carrying them in the index leaf (INCLUDE) lets
+the planner answer them with an index-only scan instead of a heap fetch per
+row. The new indexes keep the key columns of the ones they replace from 0016.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0027"
+down_revision: Union[str, None] = "0026"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index name, table, key columns, included columns)
+INDEXES = [
+    ("ix_eb_call_analyses_employee_analyzed_scores", "eb_call_analyses",
+     ["employee_id", "analyzed_at"],
+     ["transcription_status", "quality_score", "sentiment_score"]),
+    ("ix_eb_employee_metrics_period_totals", "eb_employee_metrics",
+     ["period_type", sa.text("period_start DESC")],
+     ["employee_id", "period_end", "ai_performance_score", "ai_quality_score",
+      "calls_made", "cases_progressed", "applications_submitted"]),
+]
+
+# Indexes superseded by the covering ones above: (name, table, columns)
+REPLACED = [
+    ("ix_eb_call_analyses_employee_analyzed", "eb_call_analyses",
+     ["employee_id", "analyzed_at"]),
+    ("ix_eb_employee_metrics_period", "eb_employee_metrics",
+     ["period_type", sa.text("period_start DESC")]),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns, include in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                postgresql_include=include,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        for name, table, _ in REPLACED:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in REPLACED:
+            op.create_index(
+                name, table, columns, postgresql_concurrently=True, if_not_exists=True
+            )
+        for name, table, _, _ in INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
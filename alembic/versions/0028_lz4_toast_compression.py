@@ -0,0 +1,44 @@
+"""Compress large text/JSONB columns with lz4
+
+Revision ID: 0028
+Revises: 0027
+Create Date: 2026-10-17
+
+Call transcripts, extracted document data, training metadata and lead
+profile text are routinely large enough to be TOASTed. The default pglz
+codec is several times slower to decompress than lz4, and every read of one
+of these values pays that cost. SET COMPRESSION changes the codec for values
+written from now on; existing values are read as before and pick up lz4 as
+they are rewritten. Storage stays EXTENDED: nothing reads slices of these
+values, so giving up compression (EXTERNAL) would only cost space.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0028"
+down_revision: Union[str, None] = "0027"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNS = {
+    "eb_call_analyses": ["transcription", "transcription_tsv"],
+    "eb_file_ingestions": ["extracted_data"],
+    "eb_training_records": ["metadata"],
+    "lead_info": ["profile_text"],
+}
+
+
+def _set_compression(method: str) -> None:
+    for table, columns in COLUMNS.items():
+        alters = ", ".join(f"ALTER COLUMN {col} SET COMPRESSION {method}" for col in columns)
+        op.execute(f"ALTER TABLE {table} {alters}")
+
+
+def upgrade() -> None:
+    _set_compression("lz4")
+
+
+def downgrade() -> None:
+    _set_compression("default")
@@ -0,0 +1,69 @@
+"""Maintain updated_at on eb_* tables with one shared trigger
+
+Revision ID: 0029
+Revises: 0028
+Create Date: 2026-10-17
+
+updated_at on the eb_* tables was only ever set by the ORM (onupdate or an
+explicit assignment in the service), so bulk UPDATE statements, raw SQL in
+the Celery tasks and edits made from Supabase left it stale. A single
+touch_updated_at() trigger function now stamps it on every UPDATE that did
+not set it itself. Values written by the app are kept as they are, so ORM
+objects still hold the timestamp that was stored without a refresh.
+
+Legacy tables are left alone; the Flutter apps manage their own timestamps.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0029"
+down_revision: Union[str, None] = "0028"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# eb_* tables with an updated_at column
+TABLES = [
+    "eb_action_drafts",
+    "eb_applications",
+    "eb_call_analyses",
+    "eb_cases",
+    "eb_employee_goals",
+    "eb_employee_patterns",
+    "eb_employee_schedules",
+    "eb_file_ingestions",
+    "eb_performance_reviews",
+    "eb_policies",
+    "eb_students",
+    "eb_tasks",
+    "eb_training_records",
+    "eb_users",
+    "eb_workflow_definitions",
+    "eb_workflow_instances",
+]
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE OR REPLACE FUNCTION touch_updated_at() RETURNS trigger AS $$
+        BEGIN
+            IF NEW.updated_at IS NOT DISTINCT FROM OLD.updated_at THEN
+                NEW.updated_at := now();
+            END IF;
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+    """)
+    for table in TABLES:
+        op.execute(
+            f"CREATE OR REPLACE TRIGGER {table}_touch_updated_at "
+            f"BEFORE UPDATE ON {table} "
+            f"FOR EACH ROW EXECUTE FUNCTION touch_updated_at()"
+        )
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_touch_updated_at ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS touch_updated_at()")
@@ -0,0 +1,42 @@
+"""Index applied_courses by lead
+
+Revision ID: 0030
+Revises: 0029
+Create Date: 2026-10-17
+
+list_applied_courses_for_lead filters applied_courses on user_id (the lead
+id, stored as text) and pages by created_at DESC, with nothing but the
+text primary key to use. applied_courses is a legacy table, so its text
+keys stay as they are; this only adds the index.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0030"
+down_revision: Union[str, None] = "0029"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_applied_courses_user_created",
+            "applied_courses",
+            ["user_id", sa.text("created_at DESC")],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_applied_courses_user_created",
+            table_name="applied_courses",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
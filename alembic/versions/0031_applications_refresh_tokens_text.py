@@ -0,0 +1,57 @@
+"""TEXT on eb_applications/eb_refresh_tokens, BYTEA refresh token hashes
+
+Revision ID: 0031
+Revises: 0030
+Create Date: 2026-10-17
+
+Same change as 0012 for the two eb_* tables it did not cover: the
+VARCHAR(n) columns become TEXT, which is binary-coercible and needs no
+rewrite. None of these lengths encode a business rule.
+
+eb_refresh_tokens.token_hash held a SHA-256 as 64 hex characters. Stored as
+the raw 32-byte digest it halves the row and unique-index footprint, and
+lookups compare bytes instead of going through text comparison. This one
+does rewrite the (small) table and its unique index.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0031"
+down_revision: Union[str, None] = "0030"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# table -> {column: previous VARCHAR length}
+VARCHAR_COLUMNS = {
+    "eb_applications": {
+        "university_name": 255, "university_country": 100, "program_name": 255,
+        "program_level": 50, "status": 30,
+    },
+    "eb_refresh_tokens": {"revoke_reason": 50, "ip_address": 45},
+}
+
+
+def upgrade() -> None:
+    for table, columns in VARCHAR_COLUMNS.items():
+        alters = ", ".join(f"ALTER COLUMN {col} TYPE text" for col in columns)
+        op.execute(f"ALTER TABLE {table} {alters}")
+
+    op.execute(
+        "ALTER TABLE eb_refresh_tokens "
+        "ALTER COLUMN token_hash TYPE bytea USING decode(token_hash, 'hex')"
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "ALTER TABLE eb_refresh_tokens "
+        "ALTER COLUMN token_hash TYPE varchar(255) USING encode(token_hash, 'hex')"
+    )
+
+    for table, columns in VARCHAR_COLUMNS.items():
+        alters = ", ".join(
+            f"ALTER COLUMN {col} TYPE varchar({length})" for col, length in columns.items()
+        )
+        op.execute(f"ALTER TABLE {table} {alters}")
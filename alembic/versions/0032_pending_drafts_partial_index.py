@@ -0,0 +1,43 @@
+"""Partial index for the pending approval queue
+
+Revision ID: 0032
+Revises: 0031
+Create Date: 2026-10-17
+
+list_drafts defaults to status = 'pending_approval' and pages by
+created_at DESC. Pending drafts are a small, short-lived slice of
+eb_action_drafts, so a partial index on created_at keeps the queue lookup
+off the approved/rejected/executed history.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0032"
+down_revision: Union[str, None] = "0031"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_eb_action_drafts_pending_created",
+            "eb_action_drafts",
+            [sa.text("created_at DESC")],
+            postgresql_concurrently=True,
+            postgresql_where=sa.text("status = 'pending_approval'"),
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_eb_action_drafts_pending_created",
+            table_name="eb_action_drafts",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
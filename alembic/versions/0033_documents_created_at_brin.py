@@ -0,0 +1,44 @@
+"""BRIN index on eb_documents.created_at
+
+Revision ID: 0033
+Revises: 0032
+Create Date: 2026-10-17
+
+The metrics task counts each employee's uploaded documents within a period,
+which only has the uploaded_by btree to work with. eb_documents rows arrive
+in created_at order, so a BRIN index lets the period predicate bitmap-AND
+with that btree, the same way 0018 does for call_events. A smaller
+pages_per_range than the default keeps the ranges tight on a table this size.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0033"
+down_revision: Union[str, None] = "0032"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_eb_documents_created_at_brin",
+            "eb_documents",
+            ["created_at"],
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_eb_documents_created_at_brin",
+            table_name="eb_documents",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,69 @@
+"""Fold single-column eb_cases/eb_students indexes into composites
+
+Revision ID: 0034
+Revises: 0033
+Create Date: 2026-10-17
+
+eb_cases carried two indexes led by student_id: the baseline
+ix_eb_cases_student and 0017's partial ix_eb_cases_active_student. A
+student has a handful of cases at most, so one (student_id, created_at DESC)
+index serves both the active-case lookups in auto_assign/lead_intake and the
+ai_copilot case history, which also wants them newest first. That leaves one
+index to maintain on every case insert instead of two.
+
+ix_eb_students_counselor is widened the same way for list_students, which
+pages a counselor's students by created_at DESC.
+
+ix_eb_cases_stage stays: the analytics funnel and case velocity count cases
+by current_stage alone.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0034"
+down_revision: Union[str, None] = "0033"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index name, table, columns)
+INDEXES = [
+    ("ix_eb_cases_student_created", "eb_cases",
+     ["student_id", sa.text("created_at DESC")]),
+    ("ix_eb_students_counselor_created", "eb_students",
+     ["assigned_counselor_id", sa.text("created_at DESC")]),
+]
+
+# Indexes made redundant by the ones above: (name, table, columns, predicate)
+REPLACED = [
+    ("ix_eb_cases_student", "eb_cases", ["student_id"], None),
+    ("ix_eb_cases_active_student", "eb_cases", ["student_id"], "is_active"),
+    ("ix_eb_students_counselor", "eb_students", ["assigned_counselor_id"], None),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name, table, columns, postgresql_concurrently=True, if_not_exists=True
+            )
+        for name, table, _, _ in REPLACED:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns, where in REPLACED:
+            op.create_index(
+                name,
+                table,
+                columns,
+                postgresql_where=sa.text(where) if where else None,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        for name, table, _ in INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -12,95 +12,106 @@ counselors match or scores tie.
 import logging
 from uuid import UUID
 
-from sqlalchemy import func, select, text
+from sqlalchemy import Integer, Text, bindparam, select, text, update
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.modules.cases.models import Case
+from app.modules.students.models import Student
+
 logger = logging.getLogger("empireo.auto_assign")
 
 COUNTRY_MATCH_BONUS = 30
 WORKLOAD_PENALTY = 2
 ROLE_BONUS = 10
 
+# Roles eligible for assignment (compared case-insensitively)
+COUNSELOR_ROLES = ("counselor", "manager", "admin")
+
+
+# One pass over eb_users: workload from a grouped eb_cases count, country
+# matches from the countries JSONB (strings or {"name": ...} objects)
+_SCORE_SQL = text("""
+    WITH workload AS (
+        SELECT assigned_counselor_id, count(*) AS active_cases
+        FROM eb_cases
+        WHERE is_active AND assigned_counselor_id IS NOT NULL
+        GROUP BY assigned_counselor_id
+    ),
+    candidates AS (
+        SELECT
+            u.id AS user_id,
+            u.full_name,
+            COALESCE(w.active_cases, 0) AS active_cases,
+            ARRAY(
+                SELECT pref
+                FROM unnest(:prefs) AS pref
+                WHERE lower(pref) IN (
+                    SELECT lower(CASE jsonb_typeof(c)
+                        WHEN 'string' THEN c #>> '{}'
+                        WHEN 'object' THEN coalesce(c ->> 'name', '')
+                    END)
+                    FROM jsonb_array_elements(
+                        CASE WHEN jsonb_typeof(u.countries) = 'array'
+                             THEN u.countries ELSE '[]'::jsonb END
+                    ) AS c
+                )
+            ) AS countries_matched
+        FROM eb_users u
+        LEFT JOIN workload w ON w.assigned_counselor_id = u.id
+        WHERE u.is_active
+          AND EXISTS (
+              SELECT 1
+              FROM eb_user_roles ur
+              JOIN eb_roles r ON r.id = ur.role_id
+              WHERE ur.user_id = u.id AND lower(r.name) = ANY(:roles)
+          )
+    )
+    SELECT
+        user_id,
+        full_name,
+        :role_bonus
+            + :country_bonus * cardinality(countries_matched)
+            - :workload_penalty * active_cases AS score,
+        active_cases,
+        countries_matched
+    FROM candidates
+    ORDER BY score DESC, active_cases ASC
+    LIMIT :limit
+""")
+
 
 async def score_counselors(
     db: AsyncSession,
     country_preference: list[str] | None = None,
+    limit: int | None = None,
 ) -> list[dict]:
     """Score all active counselors and return ranked list.
 
+    Scoring and ranking run in Postgres; ``limit`` caps the number of rows
+    returned (None returns every counselor).
+
     Returns list of {user_id, full_name, score, active_cases, countries_matched}.
     """
-    from app.modules.users.models import User, UserRole, Role
-    from app.modules.cases.models import Case
-
-    # Get all active users
-    users_result = await db.execute(
-        select(User).where(User.is_active.is_(True))
-    )
-    users = users_result.scalars().all()
-
-    scored = []
-    for user in users:
-        score = 0
-        countries_matched = []
-
-        # Check if user has counselor role
-        is_counselor = any(
-            r.lower() in ("counselor", "manager", "admin") for r in user.roles
+    result = await db.execute(
+        _SCORE_SQL.bindparams(
+            bindparam("prefs", list(country_preference or []), type_=ARRAY(Text)),
+            bindparam("roles", list(COUNSELOR_ROLES), type_=ARRAY(Text)),
+            bindparam("role_bonus", ROLE_BONUS, type_=Integer),
+            bindparam("country_bonus", COUNTRY_MATCH_BONUS, type_=Integer),
+            bindparam("workload_penalty", WORKLOAD_PENALTY, type_=Integer),
+            bindparam("limit", limit, type_=Integer),
         )
-        if is_counselor:
-            score += ROLE_BONUS
-
-        # Country match bonus
-        user_countries = user.countries or []
-        if country_preference and user_countries:
-            # user.countries is JSONB (could be list of strings or dicts)
-            user_country_names = set()
-            for c in user_countries:
-                if isinstance(c, str):
-                    user_country_names.add(c.lower())
-                elif isinstance(c, dict):
-                    user_country_names.add(c.get("name", "").lower())
-
-            for pref in country_preference:
-                if pref.lower() in user_country_names:
-                    score += COUNTRY_MATCH_BONUS
-                    countries_matched.append(pref)
-
-        # Workload penalty: count active cases
-        case_count_result = await db.execute(
-            select(func.count()).select_from(Case)
-            .where(
-                Case.is_active.is_(True),
-                Case.assigned_counselor_id == user.id,
-            )
-        )
-        active_cases = case_count_result.scalar() or 0
-        score -= active_cases * WORKLOAD_PENALTY
-
-        if is_counselor:  # Only include users with a counselor-like role
-            scored.append({
-                "user_id": user.id,
-                "full_name": user.full_name,
-                "score": score,
-                "active_cases": active_cases,
-                "countries_matched": countries_matched,
-            })
-
-    # Sort by score descending, then by active_cases ascending (tiebreaker: less busy first)
-    scored.sort(key=lambda x: (-x["score"], x["active_cases"]))
-    return scored
+    )
+    return [dict(row) for row in result.mappings()]
 
 
-async def auto_assign_counselor(
+async def _best_counselor(
     db: AsyncSession,
     country_preference: list[str] | None = None,
-) -> UUID | None:
-    """Pick the best counselor for a lead/student based on scoring.
-
-    Returns the UUID of the best-match counselor, or None if no counselors available.
-    """
-    ranked = await score_counselors(db, country_preference)
+) -> dict | None:
+    """Return the top-ranked counselor's score row, or None if there are none."""
+    ranked = await score_counselors(db, country_preference, limit=1)
 
     if not ranked:
         logger.warning("No counselors available for auto-assignment")
@@ -111,7 +122,19 @@ async def auto_assign_counselor(
         "Auto-assigned counselor %s (score=%d, cases=%d, countries=%s)",
         best["full_name"], best["score"], best["active_cases"], best["countries_matched"],
     )
-    return best["user_id"]
+    return best
+
+
+async def auto_assign_counselor(
+    db: AsyncSession,
+    country_preference: list[str] | None = None,
+) -> UUID | None:
+    """Pick the best counselor for a lead/student based on scoring.
+
+    Returns the UUID of the best-match counselor, or None if no counselors available.
+    """
+    best = await _best_counselor(db, country_preference)
+    return best["user_id"] if best else None
 
 
 async def auto_assign_student(
@@ -123,9 +146,6 @@ async def auto_assign_student(
 
     Returns {counselor_id, counselor_name, score} or {error}.
     """
-    from app.modules.students.models import Student
-    from app.modules.cases.models import Case
-
     # Get student
     result = await db.execute(select(Student).where(Student.id == student_id))
     student = result.scalar_one_or_none()
@@ -136,32 +156,26 @@ async def auto_assign_student(
     if not country_preference and student.preferred_countries:
         country_preference = student.preferred_countries
 
-    counselor_id = await auto_assign_counselor(db, country_preference)
-    if not counselor_id:
+    best = await _best_counselor(db, country_preference)
+    if not best:
         return {"error": "no_counselors_available"}
+    counselor_id = best["user_id"]
 
-    # Assign to student
+    # Assign to student (flushed with the case update below)
     student.assigned_counselor_id = counselor_id
-    await db.flush()
 
     # Also assign to any active cases for this student
     cases_result = await db.execute(
-        select(Case).where(Case.student_id == student_id, Case.is_active.is_(True))
+        update(Case)
+        .where(Case.student_id == student_id, Case.is_active.is_(True))
+        .values(assigned_counselor_id=counselor_id)
+        .returning(Case.id)
     )
-    cases = cases_result.scalars().all()
-    for case in cases:
-        case.assigned_counselor_id = counselor_id
-    await db.flush()
-
-    # Get counselor name for response
-    from app.modules.users.models import User
-
-    counselor_result = await db.execute(select(User).where(User.id == counselor_id))
-    counselor = counselor_result.scalar_one_or_none()
+    case_ids = cases_result.scalars().all()
 
     return {
         "student_id": str(student_id),
         "counselor_id": str(counselor_id),
-        "counselor_name": counselor.full_name if counselor else "Unknown",
-        "cases_assigned": len(cases),
+        "counselor_name": best["full_name"] or "Unknown",
+        "cases_assigned": len(case_ids),
     }
@@ -1,9 +1,11 @@
 """Redis cache layer for read-heavy queries."""
 
-import json
 import logging
+import time
+from collections import OrderedDict
 from typing import Any
 
+import orjson
 import redis.asyncio as aioredis
 
 from app.config import settings
@@ -12,18 +14,66 @@ logger = logging.getLogger("empireo.cache")
 
 _redis_pool: aioredis.Redis | None = None
 
+# In-process L1 in front of Redis for hot, rarely-changing keys. Only keys read
+# with get_cache(..., local_ttl=...) land here; entries are per worker and may
+# lag writes from other processes by up to their local_ttl.
+_L1_MAXSIZE = 10_000
+_l1: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
 
 def _get_redis() -> aioredis.Redis:
-    """Lazily initialize and return the async Redis client."""
+    """Lazily initialize and return the async Redis client.
+
+    Responses stay as bytes: cached values are orjson payloads, which
+    orjson parses straight from bytes.
+    """
     global _redis_pool
     if _redis_pool is None:
-        _redis_pool = aioredis.from_url(
+        # Bounded pool: past 50 in-flight commands callers wait for a free
+        # connection instead of opening new ones. No health_check_interval, so
+        # commands are not preceded by PINGs.
+        pool = aioredis.BlockingConnectionPool.from_url(
             settings.REDIS_URL,
-            decode_responses=True,
+            max_connections=50,
+            timeout=5,
+            socket_keepalive=True,
         )
+        _redis_pool = aioredis.Redis(connection_pool=pool)
     return _redis_pool
 
 
+async def close_redis() -> None:
+    """Close the cache Redis client and its pool (called on app shutdown)."""
+    global _redis_pool
+    if _redis_pool is not None:
+        await _redis_pool.aclose(close_connection_pool=True)
+        _redis_pool = None
+
+
+def _l1_get(key: str) -> Any | None:
+    entry = _l1.get(key)
+    if entry is None:
+        return None
+    expires_at, value = entry
+    if expires_at < time.monotonic():
+        _l1.pop(key, None)
+        return None
+    _l1.move_to_end(key)
+    return value
+
+
+def _l1_put(key: str, value: Any, ttl: float) -> None:
+    _l1[key] = (time.monotonic() + ttl, value)
+    _l1.move_to_end(key)
+    while len(_l1) > _L1_MAXSIZE:
+        _l1.popitem(last=False)
+
+
+def _dumps(value: Any) -> bytes:
+    # UUIDs and datetimes serialize natively; default=str covers the rest (e.g. Decimal)
+    return orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+
 def cache_key(*parts: str) -> str:
     """Build a namespaced cache key from parts.
 
@@ -32,20 +82,31 @@ def cache_key(*parts: str) -> str:
     return "empireo:" + ":".join(parts)
 
 
-async def get_cache(key: str) -> Any | None:
+async def get_cache(key: str, local_ttl: float = 0) -> Any | None:
     """Get a value from Redis and deserialize from JSON.
 
+    With local_ttl > 0 the value is also kept in the in-process L1 for that
+    many seconds, so repeated reads skip Redis. L1 values are shared between
+    callers and must not be mutated.
+
     Returns None if the key does not exist or on any Redis error.
     """
+    if local_ttl > 0:
+        value = _l1_get(key)
+        if value is not None:
+            return value
     try:
         r = _get_redis()
         raw = await r.get(key)
         if raw is None:
             return None
-        return json.loads(raw)
+        value = orjson.loads(raw)
     except Exception as exc:
         logger.warning("Cache GET failed for key %s: %s", key, exc)
         return None
+    if local_ttl > 0:
+        _l1_put(key, value, local_ttl)
+    return value
 
 
 async def set_cache(key: str, value: Any, ttl: int = 300) -> None:
@@ -53,16 +114,49 @@ async def set_cache(key: str, value: Any, ttl: int = 300) -> None:
 
     Default TTL is 300 seconds (5 minutes).
     """
+    _l1.pop(key, None)
     try:
         r = _get_redis()
-        serialized = json.dumps(value, default=str)
-        await r.set(key, serialized, ex=ttl)
+        await r.set(key, _dumps(value), ex=ttl)
     except Exception as exc:
         logger.warning("Cache SET failed for key %s: %s", key, exc)
 
 
+async def get_many(keys: list[str]) -> list[Any | None]:
+    """Get several values in one MGET, in the order of ``keys``.
+
+    Missing keys come back as None; on a Redis error every entry is None.
+    """
+    if not keys:
+        return []
+    try:
+        r = _get_redis()
+        raws = await r.mget(keys)
+        return [orjson.loads(raw) if raw is not None else None for raw in raws]
+    except Exception as exc:
+        logger.warning("Cache MGET failed for %d keys: %s", len(keys), exc)
+        return [None] * len(keys)
+
+
+async def set_many(items: dict[str, Any], ttl: int = 300) -> None:
+    """Store several values with the same TTL in one pipelined round trip."""
+    if not items:
+        return
+    for key in items:
+        _l1.pop(key, None)
+    try:
+        r = _get_redis()
+        pipe = r.pipeline(transaction=False)
+        for key, value in items.items():
+            pipe.set(key, _dumps(value), ex=ttl)
+        await pipe.execute()
+    except Exception as exc:
+        logger.warning("Cache SET MANY failed for %d keys: %s", len(items), exc)
+
+
 async def delete_cache(key: str) -> None:
     """Delete a single key from Redis."""
+    _l1.pop(key, None)
     try:
         r = _get_redis()
         await r.delete(key)
@@ -74,16 +168,27 @@ async def delete_pattern(pattern: str) -> None:
     """Delete all keys matching a glob pattern (for cache invalidation).
 
     Example: delete_pattern("empireo:leads:*") removes all cached lead queries.
-    Uses SCAN to avoid blocking Redis with KEYS on large datasets.
+    Uses SCAN to avoid blocking Redis with KEYS on large datasets; matched
+    keys are UNLINKed (freed in the background) through a pipeline that is
+    flushed every few SCAN batches rather than once per batch.
     """
+    _l1.clear()  # not worth glob-matching the local entries
     try:
         r = _get_redis()
+        pipe = r.pipeline(transaction=False)
+        pending = 0
         cursor = 0
         while True:
-            cursor, keys = await r.scan(cursor=cursor, match=pattern, count=100)
+            cursor, keys = await r.scan(cursor=cursor, match=pattern, count=1000)
             if keys:
-                await r.delete(*keys)
+                pipe.unlink(*keys)
+                pending += 1
+                if pending >= 16:
+                    await pipe.execute()
+                    pending = 0
             if cursor == 0:
                 break
+        if pending:
+            await pipe.execute()
     except Exception as exc:
         logger.warning("Cache DELETE PATTERN failed for %s: %s", pattern, exc)
@@ -1,15 +1,46 @@
 """Email generation and delivery service."""
 
+import hashlib
 import logging
 from typing import Any
 
 import httpx
+import orjson
 
 from app.config import settings
+from app.core.cache import cache_key, get_cache, set_cache
 from app.core.openai_service import chat_completion
 
 logger = logging.getLogger("empireo.email")
 
+# Generated emails are reused for an identical template + context for a day
+GENERATED_EMAIL_TTL = 86400
+
+SENDGRID_SEND_URL = "https://api.sendgrid.com/v3/mail/send"
+SENDER_EMAIL = "noreply@empireo.co"
+
+# Shared SendGrid client so sends reuse pooled keep-alive connections
+_sendgrid_client: httpx.AsyncClient | None = None
+
+
+def _client() -> httpx.AsyncClient:
+    """Lazily create the shared SendGrid HTTP client."""
+    global _sendgrid_client
+    if _sendgrid_client is None:
+        _sendgrid_client = httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=40),
+        )
+    return _sendgrid_client
+
+
+async def close_client() -> None:
+    """Close the shared SendGrid client (called on app shutdown)."""
+    global _sendgrid_client
+    if _sendgrid_client is not None:
+        await _sendgrid_client.aclose()
+        _sendgrid_client = None
+
 # Template system prompts for each email type
 _TEMPLATE_PROMPTS: dict[str, str] = {
     "follow_up": (
@@ -53,6 +84,9 @@ _TEMPLATE_PROMPTS: dict[str, str] = {
 async def generate_email(template_type: str, context: dict[str, Any]) -> dict[str, str]:
     """Generate an email using an AI template and context variables.
 
+    Results are cached per template and context, so an identical request
+    within GENERATED_EMAIL_TTL skips the OpenAI call.
+
     Args:
         template_type: One of "follow_up", "docs_request", "offer_congrats",
                        "payment_reminder", "welcome".
@@ -69,6 +103,15 @@ async def generate_email(template_type: str, context: dict[str, Any]) -> dict[st
             f"Valid types: {', '.join(_TEMPLATE_PROMPTS.keys())}"
         )
 
+    context_hash = hashlib.blake2b(
+        orjson.dumps(context, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS),
+        digest_size=16,
+    ).hexdigest()
+    ck = cache_key("email_gen", template_type, context_hash)
+    cached = await get_cache(ck)
+    if cached:
+        return cached
+
     context_str = "\n".join(f"- {k}: {v}" for k, v in context.items())
     user_message = f"Context:\n{context_str}\n\nGenerate the email."
 
@@ -81,14 +124,14 @@ async def generate_email(template_type: str, context: dict[str, Any]) -> dict[st
         json_mode=True,
     )
 
-    import json
-
-    parsed = json.loads(result["content"])
-    return {
+    parsed = orjson.loads(result["content"])
+    email = {
         "subject": parsed.get("subject", ""),
         "body": parsed.get("body", ""),
         "tone": parsed.get("tone", "professional"),
     }
+    await set_cache(ck, email, ttl=GENERATED_EMAIL_TTL)
+    return email
 
 
 async def send_email(
@@ -117,22 +160,20 @@ async def send_email(
 
     payload = {
         "personalizations": [{"to": [{"email": to}]}],
-        "from": {"email": "noreply@empireo.co", "name": from_name},
+        "from": {"email": SENDER_EMAIL, "name": from_name},
         "subject": subject,
         "content": [{"type": "text/html", "value": body}],
     }
 
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                "https://api.sendgrid.com/v3/mail/send",
-                json=payload,
-                headers={
-                    "Authorization": f"Bearer {api_key}",
-                    "Content-Type": "application/json",
-                },
-                timeout=30.0,
-            )
+        response = await _client().post(
+            SENDGRID_SEND_URL,
+            content=orjson.dumps(payload),
+            headers={
+                "Authorization": f"Bearer {api_key}",
+                "Content-Type": "application/json",
+            },
+        )
         if response.status_code in (200, 202):
             message_id = response.headers.get("X-Message-Id", "")
             logger.info("Email sent to %s (message_id=%s)", to, message_id)
@@ -27,8 +27,12 @@ class ApplicationStatus(PyEnum):
 
 
 # SQLAlchemy PostgreSQL Enum types for use in models
-# These reference existing PostgreSQL enums in the database
-LeadTabEnum = ENUM(LeadTab, name="leadtab", create_type=False)
-ModuleTypeEnum = ENUM(ModuleType, name="module_type", create_type=False)
-ApplicationStatusEnum = ENUM(ApplicationStatus, name="application_status", create_type=False)
-
+# These reference existing PostgreSQL enums in the database. They are declared
+# over the enum *values* (as cases.CaseStageEnum is), so columns read and write
+# the database labels as plain strings: no PyEnum lookup per row, and the
+# labels match the lowercase values rather than the member names.
+LeadTabEnum = ENUM(*(e.value for e in LeadTab), name="leadtab", create_type=False)
+ModuleTypeEnum = ENUM(*(e.value for e in ModuleType), name="module_type", create_type=False)
+ApplicationStatusEnum = ENUM(
+    *(e.value for e in ApplicationStatus), name="application_status", create_type=False
+)
@@ -1,27 +1,75 @@
 from uuid import UUID
 
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.modules.events.models import Event
 
+# Rows per INSERT in log_events (8 columns each, well under the bind limit)
+EVENT_BATCH_SIZE = 500
+
+
+def _coerce_entity_id(entity_id) -> UUID | None:
+    """Return entity_id as a UUID, or None when it is not one.
+
+    Legacy entities (leads, attendance, call events, ...) have integer ids that
+    callers pass as strings; eb_events.entity_id is a uuid column, so those are
+    not stored there. Only strings shaped like a UUID reach the parser.
+    """
+    if entity_id is None or isinstance(entity_id, UUID):
+        return entity_id
+    if isinstance(entity_id, str) and len(entity_id) == 36 and entity_id.count("-") == 4:
+        try:
+            return UUID(entity_id)
+        except ValueError:
+            return None
+    return None
+
+
+def _event_values(
+    event_type: str,
+    actor_id: UUID | None,
+    entity_type: str,
+    entity_id: UUID | str | int | None = None,
+    metadata: dict | None = None,
+    actor_type: str = "user",
+) -> dict:
+    metadata = metadata or {}
+    entity_uuid = _coerce_entity_id(entity_id)
+    if entity_uuid is None and entity_id is not None:
+        # Keep non-UUID ids on the event so it can still be traced to its row
+        metadata = {**metadata, "entity_ref": str(entity_id)}
+    return {
+        "event_type": event_type,
+        "actor_type": actor_type,
+        "actor_id": actor_id,
+        "entity_type": entity_type,
+        "entity_id": entity_uuid,
+        "event_metadata": metadata,
+    }
+
 
 async def log_event(
     db: AsyncSession,
     event_type: str,
     actor_id: UUID | None,
     entity_type: str,
-    entity_id: UUID | None = None,
+    entity_id: UUID | str | int | None = None,
     metadata: dict | None = None,
     actor_type: str = "user",
 ) -> Event:
-    event = Event(
-        event_type=event_type,
-        actor_type=actor_type,
-        actor_id=actor_id,
-        entity_type=entity_type,
-        entity_id=entity_id,
-        event_metadata=metadata or {},
-    )
+    event = Event(**_event_values(event_type, actor_id, entity_type, entity_id, metadata, actor_type))
     db.add(event)
     await db.flush()
     return event
+
+
+async def log_events(db: AsyncSession, events: list[dict]) -> None:
+    """Log many events with multi-row INSERTs instead of a flush per event.
+
+    Each item takes log_event's keyword arguments (event_type, actor_id,
+    entity_type, entity_id, metadata, actor_type).
+    """
+    rows = [_event_values(**event) for event in events]
+    for start in range(0, len(rows), EVENT_BATCH_SIZE):
+        await db.execute(insert(Event), rows[start:start + EVENT_BATCH_SIZE])
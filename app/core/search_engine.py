@@ -31,7 +31,7 @@ async def _load_search_config(db: AsyncSession) -> None:
     """Load synonyms and stopwords from DB into module-level cache."""
     global _synonym_map, _stopwords
 
-    cached = await get_cache("empireo:search:config")
+    cached = await get_cache("empireo:search:config", local_ttl=5)
     if cached:
         _synonym_map = cached.get("synonyms", {})
         _stopwords = set(cached.get("stopwords", []))
@@ -76,6 +76,18 @@ def expand_query(query: str) -> str:
     return " ".join(expanded)
 
 
+async def _set_similarity_threshold(db: AsyncSession, threshold: float) -> None:
+    """Set the cutoff used by the pg_trgm ``%`` operator for this transaction.
+
+    Filtering with ``col % :query`` rather than ``similarity(col, :query) > t``
+    lets the gin_trgm_ops indexes on the search columns answer the match.
+    """
+    await db.execute(
+        text("SELECT set_config('pg_trgm.similarity_threshold', :threshold, true)"),
+        {"threshold": str(threshold)},
+    )
+
+
 async def hybrid_search(
     db: AsyncSession,
     table_name: str,
@@ -180,9 +192,10 @@ async def hybrid_search(
 
     for col in search_columns:
         search_conditions.append(f"{col}::text ILIKE :pattern")
-        search_conditions.append(f"similarity({col}::text, :query) > 0.1")
+        search_conditions.append(f"{col}::text % :query")
 
     search_where = " OR ".join(search_conditions) if search_conditions else "TRUE"
+    await _set_similarity_threshold(db, 0.1)
 
     # Count query
     count_sql = text(f"""
@@ -261,10 +274,11 @@ async def quick_search(
     score_parts = []
     for col in search_columns:
         match_conditions.append(f"{col}::text ILIKE :pattern")
-        match_conditions.append(f"similarity({col}::text, :query) > 0.15")
+        match_conditions.append(f"{col}::text % :query")
         score_parts.append(f"COALESCE(similarity({col}::text, :query), 0)")
 
     match_where = " OR ".join(match_conditions)
+    await _set_similarity_threshold(db, 0.15)
     score_expr = " + ".join(score_parts) if score_parts else "0"
 
     sql = text(f"""
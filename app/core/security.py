@@ -54,6 +54,6 @@ def decode_token(token: str) -> dict | None:
         return None
 
 
-def hash_token(token: str) -> str:
-    """SHA-256 hash of a token for safe DB storage."""
-    return hashlib.sha256(token.encode()).hexdigest()
+def hash_token(token: str) -> bytes:
+    """SHA-256 digest of a token for safe DB storage."""
+    return hashlib.sha256(token.encode()).digest()
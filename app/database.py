@@ -20,7 +20,10 @@ def sync_session_factory() -> Session:
         if not sync_url:
             # Derive sync URL from async URL by swapping driver
             sync_url = settings.DATABASE_URL.replace("postgresql+asyncpg://", "postgresql://")
-        _sync_engine = create_engine(sync_url, echo=False, pool_size=5, max_overflow=5)
+        # Batch executemany() UPDATE/DELETEs too (INSERTs already use insertmanyvalues)
+        _sync_engine = create_engine(
+            sync_url, echo=False, pool_size=5, max_overflow=5, executemany_mode="values_plus_batch"
+        )
         _sync_session = sessionmaker(bind=_sync_engine, expire_on_commit=False)
     return _sync_session()
 
@@ -8,6 +8,8 @@ from sqlalchemy import text
 
 from app.config import settings
 from app.database import engine
+from app.core.cache import close_redis
+from app.core.email_service import close_client as close_email_client
 from app.core.logging_config import setup_logging
 from app.core.middleware import RequestIdMiddleware, BodySizeLimitMiddleware
 from app.core.exceptions import http_exception_handler, unhandled_exception_handler, validation_exception_handler
@@ -23,6 +25,8 @@ async def lifespan(app: FastAPI):
     print(f"[{settings.APP_NAME}] Database connected. Server ready.")
     yield
     # Shutdown
+    await close_email_client()
+    await close_redis()
     await engine.dispose()
 
 
@@ -1,23 +1,23 @@
-import uuid
 from datetime import datetime
 
-from sqlalchemy import Column, Date, DateTime, ForeignKey, String, Text
+from sqlalchemy import Column, Date, DateTime, ForeignKey, Text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 
+from app.core.ids import uuid7
 from app.database import Base
 
 
 class Application(Base):
     __tablename__ = "eb_applications"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     case_id = Column(UUID(as_uuid=True), ForeignKey("eb_cases.id"), nullable=False)
-    university_name = Column(String(255), nullable=False)
-    university_country = Column(String(100), nullable=True)
-    program_name = Column(String(255), nullable=False)
-    program_level = Column(String(50), nullable=True)
-    status = Column(String(30), default="draft")
+    university_name = Column(Text, nullable=False)
+    university_country = Column(Text, nullable=True)
+    program_name = Column(Text, nullable=False)
+    program_level = Column(Text, nullable=True)
+    status = Column(Text, default="draft", nullable=False)
     submitted_at = Column(DateTime(timezone=True), nullable=True)
     response_received_at = Column(DateTime(timezone=True), nullable=True)
     offer_deadline = Column(Date, nullable=True)
@@ -34,7 +34,7 @@ class ApplicationCreate(BaseModel):
 
 
 class ApplicationUpdate(BaseModel):
-    status: str | None = None
+    status: str = "draft"
     submitted_at: datetime | None = None
     response_received_at: datetime | None = None
     offer_deadline: date | None = None
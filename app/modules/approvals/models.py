@@ -1,25 +1,25 @@
-import uuid
 from datetime import datetime
 
 from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String, Text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 
+from app.core.ids import uuid7
 from app.database import Base
 
 
 class ActionDraft(Base):
     __tablename__ = "eb_action_drafts"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    action_type = Column(String(50), nullable=False)
-    entity_type = Column(String(30), nullable=False)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    action_type = Column(Text, nullable=False)
+    entity_type = Column(Text, nullable=False)
     entity_id = Column(UUID(as_uuid=True), nullable=False)
     payload = Column(JSONB, nullable=True)
-    created_by_type = Column(String(10), default="user")
+    created_by_type = Column(Text, default="user", nullable=False)
     created_by_id = Column(UUID(as_uuid=True), nullable=True)
-    status = Column(String(30), default="pending_approval")
-    requires_approval = Column(Boolean, default=True)
+    status = Column(Text, default="pending_approval", nullable=False)
+    requires_approval = Column(Boolean, default=True, nullable=False)
     approved_by = Column(UUID(as_uuid=True), ForeignKey("eb_users.id"), nullable=True)
     approved_at = Column(DateTime(timezone=True), nullable=True)
     rejection_reason = Column(Text, nullable=True)
@@ -35,15 +35,15 @@ class ActionDraft(Base):
 class ActionRun(Base):
     __tablename__ = "eb_action_runs"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     action_draft_id = Column(UUID(as_uuid=True), ForeignKey("eb_action_drafts.id"), nullable=False)
     action_type = Column(String(50), nullable=False)
-    status = Column(String(20), default="started")
+    status = Column(String(20), default="started", nullable=False)
     started_at = Column(DateTime(timezone=True), default=datetime.utcnow)
     completed_at = Column(DateTime(timezone=True), nullable=True)
     result = Column(JSONB, nullable=True)
     error = Column(Text, nullable=True)
-    retry_count = Column(Integer, default=0)
+    retry_count = Column(Integer, default=0, nullable=False)
     created_at = Column(DateTime(timezone=True), default=datetime.utcnow)
 
     draft = relationship("ActionDraft", lazy="selectin")
@@ -1,16 +1,16 @@
-import uuid
 from datetime import datetime
 
 from sqlalchemy import Column, DateTime, ForeignKey, Text
 from sqlalchemy.dialects.postgresql import UUID
 
+from app.core.ids import uuid7
 from app.database import Base
 
 
 class Attendance(Base):
     __tablename__ = "attendance"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     created_at = Column(DateTime(timezone=True), default=datetime.utcnow)
     checkinat = Column(Text, nullable=True)
     checkoutat = Column(Text, nullable=True)
@@ -1,10 +1,10 @@
-import uuid
 from datetime import datetime
 
 from sqlalchemy import Boolean, Column, DateTime, ForeignKey, String, Text
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import ENUM, UUID
 from sqlalchemy.orm import relationship
 
+from app.core.ids import uuid7
 from app.database import Base
 
 VALID_STAGES = [
@@ -24,21 +24,24 @@ VALID_STAGES = [
     "cancelled",
 ]
 
+# Native Postgres enum (migration 0019); values stay plain strings in Python
+CaseStageEnum = ENUM(*VALID_STAGES, name="case_stage", create_type=False)
+
 
 class Case(Base):
     __tablename__ = "eb_cases"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     student_id = Column(UUID(as_uuid=True), ForeignKey("eb_students.id"), nullable=True)
-    case_type = Column(String(50), default="study_abroad")
-    current_stage = Column(String(50), default="initial_consultation")
-    priority = Column(String(20), default="normal")
+    case_type = Column(String(50), default="study_abroad", nullable=False)
+    current_stage = Column(CaseStageEnum, default="initial_consultation", nullable=False)
+    priority = Column(String(20), default="normal", nullable=False)
     assigned_counselor_id = Column(UUID(as_uuid=True), ForeignKey("eb_users.id"), nullable=True)
     assigned_processor_id = Column(UUID(as_uuid=True), ForeignKey("eb_users.id"), nullable=True)
     assigned_visa_officer_id = Column(UUID(as_uuid=True), ForeignKey("eb_users.id"), nullable=True)
     target_intake = Column(String(50), nullable=True)
     notes = Column(Text, nullable=True)
-    is_active = Column(Boolean, default=True)
+    is_active = Column(Boolean, default=True, nullable=False)
     closed_at = Column(DateTime(timezone=True), nullable=True)
     close_reason = Column(String(100), nullable=True)
     created_at = Column(DateTime(timezone=True), default=datetime.utcnow)
@@ -37,12 +37,12 @@ class CaseCreate(BaseModel):
 
 
 class CaseUpdate(BaseModel):
-    current_stage: str | None = None
-    priority: str | None = None
+    current_stage: str = "initial_consultation"
+    priority: str = "normal"
     assigned_counselor_id: UUID | None = None
     assigned_processor_id: UUID | None = None
     assigned_visa_officer_id: UUID | None = None
     target_intake: str | None = None
     notes: str | None = None
-    is_active: bool | None = None
+    is_active: bool = True
     close_reason: str | None = None
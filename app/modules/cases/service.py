@@ -27,6 +27,8 @@ async def list_cases(
         stmt = stmt.where(Case.assigned_counselor_id == counselor_id)
         count_stmt = count_stmt.where(Case.assigned_counselor_id == counselor_id)
     if stage:
+        if stage not in VALID_STAGES:
+            raise BadRequestError(f"Invalid stage: {stage}")
         stmt = stmt.where(Case.current_stage == stage)
         count_stmt = count_stmt.where(Case.current_stage == stage)
 
@@ -1,5 +1,6 @@
 from sqlalchemy import BigInteger, Boolean, Column, DateTime, Integer, Numeric, String, Text
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB, TSVECTOR
+from sqlalchemy.orm import deferred
 
 from app.database import Base
 
@@ -35,10 +36,12 @@ class Course(Base):
     course_description = Column(String, nullable=True)
     special_requirements = Column(String, nullable=True)
     field_of_study = Column(Text, nullable=True)
-    embedding = Column(Text, nullable=True)  # VECTOR type - read as text
+    # Search-only columns, never returned by the API: deferred so row loads skip
+    # the large embedding/tsvector values
+    embedding = deferred(Column(Text, nullable=True))  # VECTOR type - read as text
     commission = Column(JSONB, nullable=True)
-    search_text = Column(Text, nullable=True)
-    search_vector = Column(TSVECTOR, nullable=True)
+    search_text = deferred(Column(Text, nullable=True))
+    search_vector = deferred(Column(TSVECTOR, nullable=True))
     domain = Column(Text, nullable=True)
     keywords = Column(ARRAY(Text), nullable=True)
     application_status = Column(Text, nullable=True, server_default="not_applied")
@@ -99,10 +102,10 @@ class UniversityCourse(Base):
     course_description = Column(String, nullable=True)
     special_requirements = Column(String, nullable=True)
     field_of_study = Column(Text, nullable=True)
-    embedding = Column(Text, nullable=True)
+    embedding = deferred(Column(Text, nullable=True))
     commission = Column(JSONB, nullable=True)
-    search_text = Column(Text, nullable=True)
-    search_vector = Column(TSVECTOR, nullable=True)
+    search_text = deferred(Column(Text, nullable=True))
+    search_vector = deferred(Column(TSVECTOR, nullable=True))
     domain = Column(Text, nullable=True)
     keywords = Column(ARRAY(Text), nullable=True)
     application_status = Column(Text, nullable=True, server_default="not_applied")
@@ -1,26 +1,26 @@
-import uuid
 from datetime import datetime
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, Text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 
+from app.core.ids import uuid7
 from app.database import Base
 
 
 class Document(Base):
     __tablename__ = "eb_documents"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    entity_type = Column(String(30), nullable=False)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    entity_type = Column(Text, nullable=False)
     entity_id = Column(UUID(as_uuid=True), nullable=False)
-    document_type = Column(String(50), nullable=True)
-    file_name = Column(String(255), nullable=False)
-    file_key = Column(String(500), nullable=False)
+    document_type = Column(Text, nullable=True)
+    file_name = Column(Text, nullable=False)
+    file_key = Column(Text, nullable=False)
     file_size_bytes = Column(Integer, nullable=True)
-    mime_type = Column(String(100), nullable=True)
+    mime_type = Column(Text, nullable=True)
     uploaded_by = Column(UUID(as_uuid=True), ForeignKey("eb_users.id"), nullable=True)
-    is_verified = Column(Boolean, default=False)
+    is_verified = Column(Boolean, default=False, nullable=False)
     verified_by = Column(UUID(as_uuid=True), ForeignKey("eb_users.id"), nullable=True)
     verified_at = Column(DateTime(timezone=True), nullable=True)
     notes = Column(Text, nullable=True)
@@ -1,15 +1,15 @@
-import uuid
-
-from sqlalchemy import BigInteger, Boolean, Column, Date, DateTime, Float, ForeignKey, Integer, String, Text, Time
-from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID
+from sqlalchemy import BigInteger, Boolean, Column, Computed, Date, DateTime, Float, ForeignKey, Integer, SmallInteger, String, Text, Time
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, REAL, TSVECTOR, UUID
+from sqlalchemy.orm import deferred
 
+from app.core.ids import uuid7
 from app.database import Base
 
 
 class FileIngestion(Base):
     __tablename__ = "eb_file_ingestions"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     file_name = Column(String, nullable=False)
     file_key = Column(String, nullable=False)
     file_size_bytes = Column(Integer, nullable=True)
@@ -33,8 +33,10 @@ class FileIngestion(Base):
 
 class CallAnalysis(Base):
     __tablename__ = "eb_call_analyses"
+    # Don't fetch the generated tsvector back through RETURNING on flush
+    __mapper_args__ = {"eager_defaults": False}
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     call_event_id = Column(BigInteger, ForeignKey("call_events.id"), nullable=True)
     call_uuid = Column(Text, nullable=True)
     employee_id = Column(UUID(as_uuid=True), ForeignKey("eb_users.id"), nullable=True)
@@ -43,15 +45,19 @@ class CallAnalysis(Base):
     transcription = Column(Text, nullable=True)
     transcription_status = Column(String, nullable=False, default="pending")
     transcription_model = Column(String, nullable=True)
+    # Search-only, never returned by the API: deferred so row loads skip it
+    transcription_tsv = deferred(Column(
+        TSVECTOR, Computed("to_tsvector('english', coalesce(transcription, ''))", persisted=True)
+    ))
     sentiment_score = Column(Float, nullable=True)
     quality_score = Column(Float, nullable=True)
     professionalism_score = Column(Float, nullable=True)
     resolution_score = Column(Float, nullable=True)
     summary = Column(Text, nullable=True)
-    topics = Column(JSONB, default=list)
+    topics = Column(ARRAY(Text), default=list)
     action_items = Column(JSONB, default=list)
     flags = Column(JSONB, default=list)
-    key_phrases = Column(JSONB, default=list)
+    key_phrases = Column(ARRAY(Text), default=list)
     caller_intent = Column(String, nullable=True)
     outcome = Column(String, nullable=True)
     language_detected = Column(String, nullable=True)
@@ -66,38 +72,38 @@ class CallAnalysis(Base):
 class EmployeeMetric(Base):
     __tablename__ = "eb_employee_metrics"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     employee_id = Column(UUID(as_uuid=True), ForeignKey("eb_users.id"), nullable=False)
     period_type = Column(String, nullable=False)
     period_start = Column(Date, nullable=False)
     period_end = Column(Date, nullable=False)
-    calls_made = Column(Integer, default=0)
-    calls_received = Column(Integer, default=0)
-    calls_missed = Column(Integer, default=0)
-    total_call_duration_mins = Column(Float, default=0)
-    avg_call_duration_mins = Column(Float, default=0)
-    avg_call_quality_score = Column(Float, nullable=True)
-    avg_call_sentiment = Column(Float, nullable=True)
-    leads_contacted = Column(Integer, default=0)
-    leads_converted = Column(Integer, default=0)
-    new_students_onboarded = Column(Integer, default=0)
-    cases_progressed = Column(Integer, default=0)
-    cases_closed = Column(Integer, default=0)
-    applications_submitted = Column(Integer, default=0)
-    documents_processed = Column(Integer, default=0)
-    documents_verified = Column(Integer, default=0)
-    days_present = Column(Integer, default=0)
-    days_absent = Column(Integer, default=0)
-    days_late = Column(Integer, default=0)
+    calls_made = Column(SmallInteger, default=0, nullable=False)
+    calls_received = Column(SmallInteger, default=0, nullable=False)
+    calls_missed = Column(SmallInteger, default=0, nullable=False)
+    total_call_duration_mins = Column(REAL, default=0, nullable=False)
+    avg_call_duration_mins = Column(REAL, default=0, nullable=False)
+    avg_call_quality_score = Column(REAL, nullable=True)
+    avg_call_sentiment = Column(REAL, nullable=True)
+    leads_contacted = Column(SmallInteger, default=0, nullable=False)
+    leads_converted = Column(SmallInteger, default=0, nullable=False)
+    new_students_onboarded = Column(SmallInteger, default=0, nullable=False)
+    cases_progressed = Column(SmallInteger, default=0, nullable=False)
+    cases_closed = Column(SmallInteger, default=0, nullable=False)
+    applications_submitted = Column(SmallInteger, default=0, nullable=False)
+    documents_processed = Column(SmallInteger, default=0, nullable=False)
+    documents_verified = Column(SmallInteger, default=0, nullable=False)
+    days_present = Column(SmallInteger, default=0, nullable=False)
+    days_absent = Column(SmallInteger, default=0, nullable=False)
+    days_late = Column(SmallInteger, default=0, nullable=False)
     avg_checkin_time = Column(Time, nullable=True)
     avg_checkout_time = Column(Time, nullable=True)
-    total_hours_worked = Column(Float, default=0)
-    tasks_completed = Column(Integer, default=0)
-    tasks_overdue = Column(Integer, default=0)
-    avg_task_completion_hours = Column(Float, nullable=True)
-    ai_performance_score = Column(Float, nullable=True)
-    ai_efficiency_score = Column(Float, nullable=True)
-    ai_quality_score = Column(Float, nullable=True)
+    total_hours_worked = Column(REAL, default=0, nullable=False)
+    tasks_completed = Column(SmallInteger, default=0, nullable=False)
+    tasks_overdue = Column(SmallInteger, default=0, nullable=False)
+    avg_task_completion_hours = Column(REAL, nullable=True)
+    ai_performance_score = Column(REAL, nullable=True)
+    ai_efficiency_score = Column(REAL, nullable=True)
+    ai_quality_score = Column(REAL, nullable=True)
     raw_data = Column(JSONB, default=dict)
     computed_at = Column(DateTime(timezone=True), nullable=True)
     created_at = Column(DateTime(timezone=True), nullable=True)
@@ -106,7 +112,7 @@ class EmployeeMetric(Base):
 class PerformanceReview(Base):
     __tablename__ = "eb_performance_reviews"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     employee_id = Column(UUID(as_uuid=True), ForeignKey("eb_users.id"), nullable=False)
     reviewer_id = Column(UUID(as_uuid=True), ForeignKey("eb_users.id"), nullable=True)
     review_type = Column(String, nullable=False, default="monthly")
@@ -115,9 +121,9 @@ class PerformanceReview(Base):
     scores = Column(JSONB, nullable=False, default=dict)
     overall_score = Column(Float, nullable=True)
     ai_summary = Column(Text, nullable=True)
-    ai_strengths = Column(JSONB, default=list)
-    ai_improvements = Column(JSONB, default=list)
-    ai_recommendations = Column(JSONB, default=list)
+    ai_strengths = Column(ARRAY(Text), default=list)
+    ai_improvements = Column(ARRAY(Text), default=list)
+    ai_recommendations = Column(ARRAY(Text), default=list)
     ai_comparison = Column(JSONB, default=dict)
     metrics_snapshot = Column(JSONB, default=dict)
     call_analysis_ids = Column(ARRAY(UUID(as_uuid=True)), nullable=True)
@@ -133,19 +139,19 @@ class PerformanceReview(Base):
 class EmployeeGoal(Base):
     __tablename__ = "eb_employee_goals"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     employee_id = Column(UUID(as_uuid=True), ForeignKey("eb_users.id"), nullable=False)
     title = Column(String, nullable=False)
     description = Column(Text, nullable=True)
     goal_type = Column(String, nullable=False)
     target_value = Column(Float, nullable=False)
-    current_value = Column(Float, default=0)
-    unit = Column(String, default="count")
+    current_value = Column(Float, default=0, nullable=False)
+    unit = Column(String, default="count", nullable=False)
     period_start = Column(Date, nullable=False)
     period_end = Column(Date, nullable=False)
     status = Column(String, nullable=False, default="active")
-    progress_percentage = Column(Float, default=0)
-    auto_track = Column(Boolean, default=True)
+    progress_percentage = Column(Float, default=0, nullable=False)
+    auto_track = Column(Boolean, default=True, nullable=False)
     tracking_query = Column(JSONB, nullable=True)
     created_by = Column(UUID(as_uuid=True), ForeignKey("eb_users.id"), nullable=True)
     completed_at = Column(DateTime(timezone=True), nullable=True)
@@ -156,7 +162,7 @@ class EmployeeGoal(Base):
 class WorkLog(Base):
     __tablename__ = "eb_work_logs"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     employee_id = Column(UUID(as_uuid=True), ForeignKey("eb_users.id"), nullable=False)
     activity_type = Column(String, nullable=False)
     entity_type = Column(String, nullable=True)
@@ -174,7 +180,7 @@ class WorkLog(Base):
 class EmployeePattern(Base):
     __tablename__ = "eb_employee_patterns"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     employee_id = Column(UUID(as_uuid=True), ForeignKey("eb_users.id"), nullable=False)
     pattern_type = Column(String, nullable=False)
     pattern_data = Column(JSONB, nullable=False)
@@ -184,7 +190,7 @@ class EmployeePattern(Base):
     detected_at = Column(DateTime(timezone=True), nullable=True)
     valid_from = Column(Date, nullable=True)
     valid_until = Column(Date, nullable=True)
-    is_active = Column(Boolean, default=True)
+    is_active = Column(Boolean, default=True, nullable=False)
     ai_model_used = Column(String, nullable=True)
     created_at = Column(DateTime(timezone=True), nullable=True)
     updated_at = Column(DateTime(timezone=True), nullable=True)
@@ -193,19 +199,19 @@ class EmployeePattern(Base):
 class EmployeeSchedule(Base):
     __tablename__ = "eb_employee_schedules"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     employee_id = Column(UUID(as_uuid=True), ForeignKey("eb_users.id"), nullable=False)
     schedule_type = Column(String, nullable=False, default="regular")
     day_of_week = Column(Integer, nullable=True)
     specific_date = Column(Date, nullable=True)
     start_time = Column(Time, nullable=True)
     end_time = Column(Time, nullable=True)
-    break_minutes = Column(Integer, default=60)
-    is_working_day = Column(Boolean, default=True)
+    break_minutes = Column(Integer, default=60, nullable=False)
+    is_working_day = Column(Boolean, default=True, nullable=False)
     leave_type = Column(String, nullable=True)
     leave_reason = Column(Text, nullable=True)
     approved_by = Column(UUID(as_uuid=True), ForeignKey("eb_users.id"), nullable=True)
-    status = Column(String, default="active")
+    status = Column(String, default="active", nullable=False)
     effective_from = Column(Date, nullable=False)
     effective_until = Column(Date, nullable=True)
     notes = Column(Text, nullable=True)
@@ -216,7 +222,7 @@ class EmployeeSchedule(Base):
 class TrainingRecord(Base):
     __tablename__ = "eb_training_records"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     employee_id = Column(UUID(as_uuid=True), ForeignKey("eb_users.id"), nullable=False)
     title = Column(String, nullable=False)
     training_type = Column(String, nullable=False)
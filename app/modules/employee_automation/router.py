@@ -82,10 +82,14 @@ async def api_list_call_analyses(
     size: int = Query(20, ge=1, le=100),
     employee_id: UUID | None = None,
     transcription_status: str | None = None,
+    q: str | None = Query(None, description="Keyword search over transcriptions"),
+    topic: str | None = None,
     current_user: User = Depends(require_perm("employee_automation", "read")),
     db: AsyncSession = Depends(get_db),
 ):
-    items, total = await service.list_call_analyses(db, page, size, employee_id, transcription_status)
+    items, total = await service.list_call_analyses(
+        db, page, size, employee_id, transcription_status, q, topic
+    )
     return {**paginate_metadata(total, page, size), "items": items}
 
 
@@ -61,10 +61,10 @@ class CallAnalysisOut(BaseModel):
     professionalism_score: Optional[float] = None
     resolution_score: Optional[float] = None
     summary: Optional[str] = None
-    topics: Any = []
+    topics: Optional[list[str]] = []
     action_items: Any = []
     flags: Any = []
-    key_phrases: Any = []
+    key_phrases: Optional[list[str]] = []
     caller_intent: Optional[str] = None
     outcome: Optional[str] = None
     language_detected: Optional[str] = None
@@ -140,9 +140,9 @@ class PerformanceReviewOut(BaseModel):
     scores: Any = {}
     overall_score: Optional[float] = None
     ai_summary: Optional[str] = None
-    ai_strengths: Any = []
-    ai_improvements: Any = []
-    ai_recommendations: Any = []
+    ai_strengths: Optional[list[str]] = []
+    ai_improvements: Optional[list[str]] = []
+    ai_recommendations: Optional[list[str]] = []
     ai_comparison: Any = {}
     metrics_snapshot: Any = {}
     call_analysis_ids: Optional[list[UUID]] = None
@@ -215,8 +215,8 @@ class EmployeeGoalUpdate(BaseModel):
     title: Optional[str] = None
     description: Optional[str] = None
     target_value: Optional[float] = None
-    current_value: Optional[float] = None
-    status: Optional[str] = None
+    current_value: float = 0
+    status: str = "active"
 
 
 # --------------- Work Log ---------------
@@ -316,11 +316,11 @@ class EmployeeScheduleCreate(BaseModel):
 class EmployeeScheduleUpdate(BaseModel):
     start_time: Optional[time] = None
     end_time: Optional[time] = None
-    break_minutes: Optional[int] = None
-    is_working_day: Optional[bool] = None
+    break_minutes: int = 60
+    is_working_day: bool = True
     leave_type: Optional[str] = None
     leave_reason: Optional[str] = None
-    status: Optional[str] = None
+    status: str = "active"
     effective_until: Optional[date] = None
     notes: Optional[str] = None
 
@@ -82,6 +82,8 @@ async def list_call_analyses(
     size: int = 20,
     employee_id: UUID | None = None,
     transcription_status: str | None = None,
+    q: str | None = None,
+    topic: str | None = None,
 ) -> tuple[list[CallAnalysis], int]:
     stmt = select(CallAnalysis)
     count_stmt = select(func.count()).select_from(CallAnalysis)
@@ -92,9 +94,19 @@ async def list_call_analyses(
     if transcription_status:
         stmt = stmt.where(CallAnalysis.transcription_status == transcription_status)
         count_stmt = count_stmt.where(CallAnalysis.transcription_status == transcription_status)
+    if topic:
+        stmt = stmt.where(CallAnalysis.topics.contains([topic]))
+        count_stmt = count_stmt.where(CallAnalysis.topics.contains([topic]))
+
+    order_by = [CallAnalysis.created_at.desc()]
+    if q:
+        ts_query = func.plainto_tsquery("english", q)
+        stmt = stmt.where(CallAnalysis.transcription_tsv.op("@@")(ts_query))
+        count_stmt = count_stmt.where(CallAnalysis.transcription_tsv.op("@@")(ts_query))
+        order_by.insert(0, func.ts_rank(CallAnalysis.transcription_tsv, ts_query).desc())
 
     total = (await db.execute(count_stmt)).scalar()
-    stmt = stmt.offset((page - 1) * size).limit(size).order_by(CallAnalysis.created_at.desc())
+    stmt = stmt.offset((page - 1) * size).limit(size).order_by(*order_by)
     result = await db.execute(stmt)
     return result.scalars().all(), total
 
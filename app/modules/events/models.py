@@ -1,16 +1,16 @@
-import uuid
 from datetime import datetime
 
 from sqlalchemy import Column, DateTime, String
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 
+from app.core.ids import uuid7
 from app.database import Base
 
 
 class Event(Base):
     __tablename__ = "eb_events"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     event_type = Column(String(100), nullable=False)
     actor_type = Column(String(30), nullable=True)
     actor_id = Column(UUID(as_uuid=True), nullable=True)
@@ -1,15 +1,14 @@
-import uuid
-
 from sqlalchemy import BigInteger, Boolean, Column, DateTime, Integer, Text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 
+from app.core.ids import uuid7
 from app.database import Base
 
 
 class ConversationSession(Base):
     __tablename__ = "conversation_sessions"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, server_default="gen_random_uuid()")
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default="gen_random_uuid()")
     lead_id = Column(BigInteger, nullable=True)
     ig_user_id = Column(Text, nullable=False)
     status = Column(Text, nullable=False, server_default="active")
@@ -28,7 +27,7 @@ class ConversationSession(Base):
 class DMTemplate(Base):
     __tablename__ = "dm_templates"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, server_default="gen_random_uuid()")
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default="gen_random_uuid()")
     trigger_type = Column(Text, nullable=False)
     system_prompt = Column(Text, nullable=False)
     opening_message = Column(Text, nullable=False)
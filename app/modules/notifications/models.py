@@ -1,23 +1,23 @@
-import uuid
 from datetime import datetime
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, String, Text
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 
+from app.core.ids import uuid7
 from app.database import Base
 
 
 class Notification(Base):
     __tablename__ = "eb_notifications"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(UUID(as_uuid=True), ForeignKey("eb_users.id"), nullable=False)
-    title = Column(String(255), nullable=False)
+    title = Column(Text, nullable=False)
     message = Column(Text, nullable=True)
-    notification_type = Column(String(30), default="general")
-    entity_type = Column(String(30), nullable=True)
+    notification_type = Column(Text, default="general", nullable=False)
+    entity_type = Column(Text, nullable=True)
     entity_id = Column(UUID(as_uuid=True), nullable=True)
     data = Column(JSONB, nullable=True)
-    is_read = Column(Boolean, default=False)
+    is_read = Column(Boolean, default=False, nullable=False)
     read_at = Column(DateTime(timezone=True), nullable=True)
     created_at = Column(DateTime(timezone=True), default=datetime.utcnow)
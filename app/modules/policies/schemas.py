@@ -31,4 +31,4 @@ class PolicyUpdate(BaseModel):
     category: str | None = None
     content: str | None = None
     department: str | None = None
-    is_active: bool | None = None
+    is_active: bool = True
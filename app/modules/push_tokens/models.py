@@ -1,15 +1,14 @@
-import uuid
-
 from sqlalchemy import Column, DateTime, ForeignKey, Text
 from sqlalchemy.dialects.postgresql import UUID
 
+from app.core.ids import uuid7
 from app.database import Base
 
 
 class UserPushToken(Base):
     __tablename__ = "user_push_tokens"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(UUID(as_uuid=True), ForeignKey("auth.users.id"), nullable=False)
     fcm_token = Column(Text, nullable=False, unique=True)
     created_at = Column(DateTime(timezone=True), nullable=True)
@@ -19,7 +18,7 @@ class UserPushToken(Base):
 class UserFCMToken(Base):
     __tablename__ = "user_fcm_tokens"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(UUID(as_uuid=True), ForeignKey("auth.users.id"), nullable=False)
     fcm_token = Column(Text, nullable=False)
     created_at = Column(DateTime(timezone=True), nullable=True)
@@ -60,7 +60,7 @@ class StudentUpdate(BaseModel):
     education_details: dict | list | None = None
     english_test_type: str | None = None
     english_test_score: str | None = None
-    work_experience_years: int | None = None
+    work_experience_years: int = 0
     preferred_countries: list | None = None
     preferred_programs: list | None = None
     assigned_counselor_id: UUID | None = None
@@ -39,5 +39,5 @@ class TaskUpdate(BaseModel):
     description: str | None = None
     assigned_to: UUID | None = None
     due_at: datetime | None = None
-    priority: str | None = None
-    status: str | None = None
+    priority: str = "normal"
+    status: str = "pending"
@@ -1,26 +1,26 @@
-import uuid
 from datetime import datetime
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, String, Text
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 
+from app.core.ids import uuid7
 from app.database import Base
 
 
 class User(Base):
     __tablename__ = "eb_users"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    email = Column(String(255), unique=True, nullable=False)
-    phone = Column(String(20), nullable=True)
-    full_name = Column(String(255), nullable=False)
-    hashed_password = Column(String(255), nullable=False)
-    department = Column(String(100), nullable=True)
-    is_active = Column(Boolean, default=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    email = Column(Text, unique=True, nullable=False)
+    phone = Column(Text, nullable=True)
+    full_name = Column(Text, nullable=False)
+    hashed_password = Column(Text, nullable=False)
+    department = Column(Text, nullable=True)
+    is_active = Column(Boolean, default=True, nullable=False)
     profile_picture = Column(Text, nullable=True)
-    caller_id = Column(String(50), nullable=True)
-    location = Column(String(100), nullable=True)
+    caller_id = Column(Text, nullable=True)
+    location = Column(Text, nullable=True)
     countries = Column(JSONB, nullable=True)
     last_login_at = Column(DateTime(timezone=True), nullable=True)
     legacy_supabase_id = Column(UUID(as_uuid=True), unique=True, nullable=True)
@@ -37,8 +37,8 @@ class User(Base):
 class Role(Base):
     __tablename__ = "eb_roles"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    name = Column(String(50), unique=True, nullable=False)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    name = Column(Text, unique=True, nullable=False)
     description = Column(Text, nullable=True)
     created_at = Column(DateTime(timezone=True), default=datetime.utcnow)
 
@@ -48,9 +48,9 @@ class Role(Base):
 class Permission(Base):
     __tablename__ = "eb_permissions"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    resource = Column(String(50), nullable=False)
-    action = Column(String(50), nullable=False)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    resource = Column(Text, nullable=False)
+    action = Column(Text, nullable=False)
     description = Column(Text, nullable=True)
 
 
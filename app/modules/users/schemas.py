@@ -39,7 +39,7 @@ class UserUpdate(BaseModel):
     full_name: str | None = None
     phone: str | None = None
     department: str | None = None
-    is_active: bool | None = None
+    is_active: bool = True
     profile_picture: str | None = None
     caller_id: str | None = None
     location: str | None = None
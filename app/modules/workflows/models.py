@@ -1,20 +1,20 @@
-import uuid
 from datetime import datetime
 
 from sqlalchemy import Boolean, Column, DateTime, ForeignKey, String
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 
+from app.core.ids import uuid7
 from app.database import Base
 
 
 class WorkflowDefinition(Base):
     __tablename__ = "eb_workflow_definitions"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     name = Column(String(100), unique=True, nullable=False)
     stages = Column(JSONB, nullable=True)
     transitions = Column(JSONB, nullable=True)
-    is_active = Column(Boolean, default=True)
+    is_active = Column(Boolean, default=True, nullable=False)
     created_at = Column(DateTime(timezone=True), default=datetime.utcnow)
     updated_at = Column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow)
 
@@ -22,7 +22,7 @@ class WorkflowDefinition(Base):
 class WorkflowInstance(Base):
     __tablename__ = "eb_workflow_instances"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     workflow_definition_id = Column(UUID(as_uuid=True), ForeignKey("eb_workflow_definitions.id"), nullable=False)
     entity_type = Column(String(30), nullable=False)
     entity_id = Column(UUID(as_uuid=True), nullable=False)
@@ -1,13 +1,14 @@
 """Celery tasks for async processing: transcription, document extraction, metrics, notifications."""
 
 import asyncio
+import json
 import logging
 import mimetypes
 import os
 import tempfile
-import uuid
 from datetime import datetime, date, time, timedelta, timezone
 
+from app.core.ids import uuid7
 from app.workers.celery_app import celery
 
 logger = logging.getLogger("empireo.worker")
@@ -92,6 +93,15 @@ def _extract_text_from_file(file_path: str, mime_type: str | None = None) -> str
             raise RuntimeError(f"Cannot extract text from mime type: {mime_type}")
 
 
+def _as_text_list(value) -> list[str]:
+    """Coerce an AI-returned list (or stray scalar) into a TEXT[]-safe list of strings."""
+    if value is None:
+        return []
+    if not isinstance(value, list):
+        value = [value]
+    return [item if isinstance(item, str) else json.dumps(item) for item in value]
+
+
 # ---------------------------------------------------------------------------
 # Task: send_notification (EXISTING - kept as-is)
 # ---------------------------------------------------------------------------
@@ -286,10 +296,10 @@ def transcribe_call(self, call_analysis_id: str):
                 analysis.professionalism_score = analysis_result.get("professionalism_score")
                 analysis.resolution_score = analysis_result.get("resolution_score")
                 analysis.summary = analysis_result.get("summary")
-                analysis.topics = analysis_result.get("topics", [])
+                analysis.topics = _as_text_list(analysis_result.get("topics"))
                 analysis.action_items = analysis_result.get("action_items", [])
                 analysis.flags = analysis_result.get("flags", [])
-                analysis.key_phrases = analysis_result.get("key_phrases", [])
+                analysis.key_phrases = _as_text_list(analysis_result.get("key_phrases"))
                 analysis.caller_intent = analysis_result.get("caller_intent")
                 analysis.outcome = analysis_result.get("outcome")
                 analysis.ai_model_used = analysis_result.get("ai_model_used", "gpt-4o-mini")
@@ -401,7 +411,7 @@ def process_file_ingestion(self, ingestion_id: str):
                 # For audio files, create a CallAnalysis record and dispatch transcription
                 logger.info("File ingestion %s is audio, dispatching transcribe_call", ingestion_id)
                 call_analysis = CallAnalysis(
-                    id=uuid.uuid4(),
+                    id=uuid7(),
                     employee_id=ingestion.employee_id,
                     recording_url=None,  # We have the S3 file, not a URL
                     transcription_status="pending",
@@ -442,10 +452,10 @@ def process_file_ingestion(self, ingestion_id: str):
                         call_analysis.professionalism_score = analysis_data.get("professionalism_score")
                         call_analysis.resolution_score = analysis_data.get("resolution_score")
                         call_analysis.summary = analysis_data.get("summary")
-                        call_analysis.topics = analysis_data.get("topics", [])
+                        call_analysis.topics = _as_text_list(analysis_data.get("topics"))
                         call_analysis.action_items = analysis_data.get("action_items", [])
                         call_analysis.flags = analysis_data.get("flags", [])
-                        call_analysis.key_phrases = analysis_data.get("key_phrases", [])
+                        call_analysis.key_phrases = _as_text_list(analysis_data.get("key_phrases"))
                         call_analysis.caller_intent = analysis_data.get("caller_intent")
                         call_analysis.outcome = analysis_data.get("outcome")
                         call_analysis.ai_model_used = analysis_data.get("ai_model_used", "gpt-4o-mini")
@@ -1026,7 +1036,7 @@ def compute_employee_metrics(self, employee_id: str, period_type: str = "daily")
 
             if metric is None:
                 metric = EmployeeMetric(
-                    id=uuid.uuid4(),
+                    id=uuid7(),
                     employee_id=employee_id,
                     period_type=period_type,
                     period_start=period_start,
@@ -1444,7 +1454,7 @@ def detect_stuck_cases():
 
                 # Create follow-up task
                 task = TaskModel(
-                    id=uuid.uuid4(),
+                    id=uuid7(),
                     entity_type="case",
                     entity_id=case.id,
                     title=f"Stuck case: {stage} for {days_in_stage} days",
@@ -1464,7 +1474,7 @@ def detect_stuck_cases():
                 # Notify the counselor
                 if counselor_id:
                     notification = Notification(
-                        id=uuid.uuid4(),
+                        id=uuid7(),
                         user_id=counselor_id,
                         title=f"Case stuck in {stage}",
                         message=(
@@ -1491,7 +1501,7 @@ def detect_stuck_cases():
                     escalated_count += 1
                     for admin_id in admin_ids:
                         admin_notification = Notification(
-                            id=uuid.uuid4(),
+                            id=uuid7(),
                             user_id=admin_id,
                             title=f"ESCALATION: Case stuck {days_in_stage} days in {stage}",
                             message=(
@@ -13,12 +13,39 @@ set -euo pipefail
 #   ./scripts/migrate.sh current            # Show current revision
 #   ./scripts/migrate.sh history            # Show migration history
 #   ./scripts/migrate.sh seed               # Run permission seeder
+#   ./scripts/migrate.sh sql                # Print the full upgrade as plain SQL
+#   ./scripts/migrate.sh bootstrap          # Build a FRESH dev DB via psql
 #
 # For Docker:
 #   docker compose exec api ./scripts/migrate.sh
+#
+# Set ALEMBIC_SKIP_LOGGING=1 to keep alembic.ini from reconfiguring logging
+# (e.g. in production jobs where logging is already set up).
+# Set ALEMBIC_SKIP_LEGACY=1 to autogenerate against the eb_* models only.
+#
+# `sql` and `bootstrap` render `alembic upgrade head --sql` once and cache it in
+# .alembic-sql-cache/, keyed by a hash of the migration scripts, so fresh dev
+# databases are built by streaming a static file instead of running Alembic.
+# The api image has no psql; pipe `sql` into the postgres container instead:
+#   docker compose exec -T api ./scripts/migrate.sh sql \
+#     | docker compose exec -T postgres psql -v ON_ERROR_STOP=1 -U empireo -d empireo
 # ─────────────────────────────────────────────────────────────────────────────
 
 CMD="${1:-upgrade}"
+SQL_CACHE_DIR=".alembic-sql-cache"
+
+render_sql() {
+    local key file
+    key="$(cat alembic/env.py alembic/versions/*.py | sha256sum | cut -c1-16)"
+    file="$SQL_CACHE_DIR/upgrade-$key.sql"
+    if [[ ! -f "$file" ]]; then
+        mkdir -p "$SQL_CACHE_DIR"
+        rm -f "$SQL_CACHE_DIR"/upgrade-*.sql
+        alembic upgrade head --sql > "$file.tmp"
+        mv "$file.tmp" "$file"
+    fi
+    echo "$file"
+}
 
 case "$CMD" in
     upgrade)
@@ -58,9 +85,23 @@ case "$CMD" in
         echo "🌱 Seeding roles and permissions..."
         python -m app.scripts.seed_permissions
         ;;
+    sql)
+        cat "$(render_sql)"
+        exit 0
+        ;;
+    bootstrap)
+        # Fresh databases only. The live DB is stamped, and the script stops
+        # at its existing alembic_version table anyway.
+        SQL_FILE="$(render_sql)"
+        URL="${DATABASE_URL_SYNC:-${DATABASE_URL:?DATABASE_URL_SYNC or DATABASE_URL must be set}}"
+        URL="${URL/+asyncpg/}"
+        URL="${URL/+psycopg2/}"
+        echo "🧱 Building fresh database from $SQL_FILE"
+        psql "$URL" -v ON_ERROR_STOP=1 -q -f "$SQL_FILE"
+        ;;
     *)
         echo "Unknown command: $CMD"
-        echo "Usage: migrate.sh [upgrade|downgrade|stamp|revision|autogenerate|current|history|seed]"
+        echo "Usage: migrate.sh [upgrade|downgrade|stamp|revision|autogenerate|current|history|seed|sql|bootstrap]"
         exit 1
         ;;
 esac